@@ -7,15 +7,21 @@ from typing import Annotated
 from fastapi import Depends
 from fastapi import FastAPI
 
+from reticulum_openapi.client import LXMFClient
+from reticulum_openapi.integrations.fastapi import ORJSONResponse
+
 from .dependencies import ServerIdentityHash
+from .dependencies import client_lifespan
 from .dependencies import get_lxmf_client
 from .dependencies import get_server_identity_hash
-from .dependencies import register_client_events
 from .routes_events import router as events_router
 
 
-app = FastAPI(title="Emergency Management North API Client")
-register_client_events(app)
+app = FastAPI(
+    title="Emergency Management North API Client",
+    default_response_class=ORJSONResponse,
+    lifespan=client_lifespan,
+)
 app.include_router(events_router)
 
 
@@ -38,11 +44,11 @@ async def read_server_identity(
 @app.get("/client/status")
 async def client_status(
     server_identity_hash: Annotated[str, Depends(get_server_identity_hash)],
+    _client: Annotated[LXMFClient, Depends(get_lxmf_client)],
 ) -> dict[str, str]:
     """Expose the configured server identity hash to confirm the client is ready."""
 
-    # Reason: Accessing the dependency ensures FastAPI initialises the client during startup.
-    _ = get_lxmf_client()
+    # Reason: depending on the client ensures it is initialised before replying.
     return {"server_identity_hash": server_identity_hash}
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Annotated
+from typing import AsyncContextManager
 
 from fastapi import Depends
 from fastapi import FastAPI
@@ -17,13 +18,15 @@ from .config import get_config
 _client_manager = LXMFClientManager(get_config)
 
 
-def get_lxmf_client() -> LXMFClient:
+# Reason: both dependencies are coroutines so FastAPI resolves them on the
+# event loop instead of dispatching each call to the anyio thread pool.
+async def get_lxmf_client() -> LXMFClient:
     """Return the configured LXMF client instance."""
 
     return _client_manager.get_client()
 
 
-def get_server_identity_hash() -> str:
+async def get_server_identity_hash() -> str:
     """Return the configured server identity hash without user interaction."""
 
     identity = _client_manager.get_server_identity()
@@ -35,6 +38,12 @@ def get_server_identity_hash() -> str:
 ServerIdentityHash = Annotated[str, Depends(get_server_identity_hash)]
 
 
+def client_lifespan(app: FastAPI) -> AsyncContextManager[None]:
+    """Create the LXMF client at startup and shut it down when the app stops."""
+
+    return _client_manager.lifespan()(app)
+
+
 def register_client_events(app: FastAPI) -> None:
     """Attach lifecycle events for creating and shutting down the client."""
 
@@ -44,6 +53,7 @@ def register_client_events(app: FastAPI) -> None:
 __all__ = [
     "NorthAPIClientSettings",
     "ServerIdentityHash",
+    "client_lifespan",
     "get_lxmf_client",
     "get_server_identity_hash",
     "register_client_events",
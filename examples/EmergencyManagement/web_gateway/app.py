@@ -3,22 +3,27 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import logging
+import inspect
 import os
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Type
 
-from importlib import metadata
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response, status
+from fastapi import Depends, FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 from examples.EmergencyManagement.Server.models_emergency import (
     DeleteEmergencyActionMessageResult,
@@ -42,6 +47,8 @@ from examples.EmergencyManagement.client.client_emergency import (
     read_server_identity_from_config,
     write_client_config,
 )
+from reticulum_openapi import __version__ as _PACKAGE_VERSION
+from reticulum_openapi import _multiprocessing_compat as _mp_compat
 from reticulum_openapi.api.notifications import (
     attach_client_notifications,
     router as notifications_router,
@@ -50,13 +57,18 @@ from reticulum_openapi.integrations.fastapi import CommandSpec
 from reticulum_openapi.integrations.fastapi import LXMFCommandContext
 from reticulum_openapi.integrations.fastapi import LXMFClientManager
 from reticulum_openapi.integrations.fastapi import LinkManager
+from reticulum_openapi.integrations.fastapi import LinkStatus
+from reticulum_openapi.integrations.fastapi import ORJSONResponse
+from reticulum_openapi.integrations.fastapi import ORJSONRoute
 from reticulum_openapi.integrations.fastapi import create_command_context_dependency
 from reticulum_openapi.integrations.fastapi import create_settings_loader
 from reticulum_openapi.integrations.fastapi import gather_interface_status
+from reticulum_openapi.logging_config import configure_logging
 
 ConfigDict = Dict[str, Any]
+ConfigView = Mapping[str, Any]
 
-logger = logging.getLogger(__name__)
+logger = configure_logging(logger_name=__name__, stream=sys.stdout)
 
 load_dotenv()
 
@@ -74,7 +86,114 @@ COMMAND_DELETE_EVENT = "DeleteEvent"
 COMMAND_LIST_EVENT = "ListEvent"
 COMMAND_PUT_EVENT = "PutEvent"
 COMMAND_RETRIEVE_EVENT = "RetrieveEvent"
-_LINK_RETRY_DELAY_SECONDS = 30.0  # seconds between link retries
+_LINK_RETRY_DELAY_SECONDS = 30.0  # cap on the backoff between link retries
+_LINK_INITIAL_RETRY_DELAY_SECONDS = 1.0  # first retry delay after a failure
+_LINK_KEEPALIVE_INTERVAL_SECONDS = 60.0  # seconds between link keepalive probes
+_INTERFACE_STATUS_TTL_SECONDS = 2.0  # seconds an interface snapshot stays fresh
+
+# Reason: status codes used inside request handlers are bound once so each
+# response or raise site reads a module global instead of an attribute.
+_HTTP_201 = status.HTTP_201_CREATED
+_HTTP_204 = status.HTTP_204_NO_CONTENT
+_HTTP_422 = status.HTTP_422_UNPROCESSABLE_ENTITY
+_HTTP_503 = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class EmergencyActionMessageBody(BaseModel):
+    """Request body accepted when creating an emergency action message."""
+
+    callsign: str
+    groupName: Optional[str] = None
+    securityStatus: Optional[str] = None
+    securityCapability: Optional[str] = None
+    preparednessStatus: Optional[str] = None
+    medicalStatus: Optional[str] = None
+    mobilityStatus: Optional[str] = None
+    commsStatus: Optional[str] = None
+    commsMethod: Optional[str] = None
+
+
+class EmergencyActionMessageUpdateBody(EmergencyActionMessageBody):
+    """Request body accepted when updating an emergency action message."""
+
+    callsign: Optional[str] = None
+
+
+class EventDetailBody(BaseModel):
+    """Nested event detail carrying an optional emergency action message."""
+
+    emergencyActionMessage: Optional[EmergencyActionMessageBody] = None
+
+
+class EventPointBody(BaseModel):
+    """Geographical point attached to an event."""
+
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    ce: Optional[float] = None
+    le: Optional[float] = None
+    hae: Optional[float] = None
+
+
+class EventBody(BaseModel):
+    """Request body accepted when creating an event."""
+
+    uid: int
+    how: Optional[str] = None
+    version: Optional[int] = None
+    time: Optional[int] = None
+    type: Optional[str] = None
+    stale: Optional[str] = None
+    start: Optional[str] = None
+    access: Optional[str] = None
+    opex: Optional[int] = None
+    qos: Optional[int] = None
+    detail: Optional[EventDetailBody] = None
+    point: Optional[EventPointBody] = None
+
+
+class EventUpdateBody(EventBody):
+    """Request body accepted when updating an event."""
+
+    uid: Optional[int] = None
+
+
+class LinkStatusBody(BaseModel):
+    """Link state reported by the gateway status endpoints."""
+
+    state: str
+    message: Optional[str] = None
+    serverIdentity: Optional[str] = None
+    lastAttempt: Optional[str] = None
+    lastSuccess: Optional[str] = None
+    lastError: Optional[str] = None
+
+
+class InterfaceStatusBody(BaseModel):
+    """Status metadata for one Reticulum interface."""
+
+    id: str
+    name: str
+    type: str
+    online: bool
+    mode: Optional[str] = None
+    bitrate: Optional[int] = None
+
+
+class GatewayStatus(BaseModel):
+    """Response body returned by ``GET /``."""
+
+    version: str
+    startedAt: str
+    clientDisplayName: str
+    requestTimeoutSeconds: float
+    lxmfConfigPath: str
+    lxmfStoragePath: Optional[str] = None
+    allowedOrigins: List[str]
+    uptime: str
+    serverIdentity: Optional[str] = None
+    linkStatus: LinkStatusBody
+    reticulumInterfaces: List[InterfaceStatusBody]
 
 
 def _parse_allowed_origins(raw_value: Optional[str]) -> List[str]:
@@ -82,12 +201,7 @@ def _parse_allowed_origins(raw_value: Optional[str]) -> List[str]:
 
     if not raw_value:
         return []
-    origins = []
-    for candidate in raw_value.split(","):
-        cleaned = candidate.strip()
-        if cleaned:
-            origins.append(cleaned)
-    return origins
+    return [origin for origin in map(str.strip, raw_value.split(",")) if origin]
 
 
 _ALLOWED_ORIGINS: List[str] = _parse_allowed_origins(
@@ -97,24 +211,46 @@ if not _ALLOWED_ORIGINS:
     _ALLOWED_ORIGINS = ["*"]
 
 
-app = FastAPI(title="Emergency Management Gateway")
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run gateway startup before serving and teardown once the server stops."""
+
+    await _startup()
+    try:
+        yield
+    finally:
+        await _shutdown()
+
+
+app = FastAPI(
+    title="Emergency Management Gateway",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+# Reason: request bodies are decoded with orjson before the pydantic body
+# models validate them; routes declared below inherit this class.
+app.router.route_class = ORJSONRoute
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_ALLOWED_ORIGINS,
     allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Reason: listing what the web UI actually sends lets browsers cache the
+    # preflight answer for a day instead of repeating OPTIONS per resource.
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type", "X-Server-Identity"],
+    max_age=86400,
 )
 app.include_router(notifications_router)
 
 
 def _resolve_gateway_version() -> str:
-    """Return the installed package version or a development placeholder."""
+    """Return the package version reported by the gateway.
 
-    try:
-        return metadata.version("reticulum-openapi")
-    except metadata.PackageNotFoundError:
-        return "0.1.0-dev"
+    The version is read from ``reticulum_openapi.__version__``, which also feeds
+    the packaging metadata, so no distribution lookup runs at import time.
+    """
+
+    return _PACKAGE_VERSION
 
 
 _SETTINGS_LOADER = create_settings_loader(
@@ -124,46 +260,20 @@ _SETTINGS_LOADER = create_settings_loader(
 )
 
 
-def _create_client(settings) -> LXMFClient:
-    """Instantiate the shared LXMF client based on configuration data."""
+def _create_client(_settings: object) -> LXMFClient:
+    """Instantiate the shared LXMF client for the client manager.
 
-    client = LXMFClient(
-        config_path=settings.lxmf_config_path,
-        storage_path=settings.lxmf_storage_path,
-        display_name=settings.client_display_name,
-        timeout=settings.request_timeout_seconds,
-        shared_instance_rpc_key=settings.shared_instance_rpc_key,
-    )
-    return client
+    The manager's settings are not used: the gateway's own config mapping
+    also carries the shared-instance RPC switch and the Reticulum config
+    default that ``_create_client_from_config`` applies.
+    """
+
+    return _create_client_from_config()
 
 
 _CLIENT_MANAGER = LXMFClientManager(_SETTINGS_LOADER, client_factory=_create_client)
-_CLIENT_MANAGER_ORIGINAL_GET_CLIENT = _CLIENT_MANAGER.get_client
 _CLIENT_MANAGER_ORIGINAL_GET_SERVER_IDENTITY = _CLIENT_MANAGER.get_server_identity
-_CLIENT_INSTANCE: Optional[LXMFClient] = None
 _DEFAULT_SERVER_IDENTITY: Optional[str] = None
-
-
-def get_shared_client() -> LXMFClient:
-    """Return the shared LXMF client, honouring in-process test overrides."""
-
-    global _CLIENT_INSTANCE
-    if _CLIENT_INSTANCE is not None:
-        return _CLIENT_INSTANCE
-    client = _CLIENT_MANAGER_ORIGINAL_GET_CLIENT()
-    _CLIENT_INSTANCE = client
-    return client
-
-
-def _manager_get_client_override(self: LXMFClientManager) -> LXMFClient:
-    """Return the shared LXMF client via the module-level accessor."""
-
-    return get_shared_client()
-
-
-_CLIENT_MANAGER.get_client = _manager_get_client_override.__get__(
-    _CLIENT_MANAGER, LXMFClientManager
-)
 _NOTIFICATION_UNSUBSCRIBER: Optional[Callable[[], Awaitable[None]]] = None
 
 
@@ -189,7 +299,9 @@ def _manager_get_server_identity_override(
 _CLIENT_MANAGER.get_server_identity = _manager_get_server_identity_override.__get__(
     _CLIENT_MANAGER, LXMFClientManager
 )
-_LINK_MANAGER = LinkManager(get_shared_client)
+# Reason: list views are polled by the web UI; answering repeats from a short
+# cache keeps them off the mesh, and any write through the gateway clears it.
+_LIST_CACHE_TTL_SECONDS = 2.0
 _COMMAND_SPECS: Dict[str, CommandSpec] = {
     "eam:create": CommandSpec(
         command=COMMAND_CREATE_EAM,
@@ -205,10 +317,13 @@ _COMMAND_SPECS: Dict[str, CommandSpec] = {
     "eam:list": CommandSpec(
         command=COMMAND_LIST_EAM,
         response_type=List[EmergencyActionMessage],
+        idempotent=True,
+        cache_ttl_seconds=_LIST_CACHE_TTL_SECONDS,
     ),
     "eam:retrieve": CommandSpec(
         command=COMMAND_RETRIEVE_EAM,
         response_type=Optional[EmergencyActionMessage],
+        idempotent=True,
     ),
     "eam:delete": CommandSpec(
         command=COMMAND_DELETE_EAM,
@@ -228,10 +343,13 @@ _COMMAND_SPECS: Dict[str, CommandSpec] = {
     "event:list": CommandSpec(
         command=COMMAND_LIST_EVENT,
         response_type=List[Event],
+        idempotent=True,
+        cache_ttl_seconds=_LIST_CACHE_TTL_SECONDS,
     ),
     "event:retrieve": CommandSpec(
         command=COMMAND_RETRIEVE_EVENT,
         response_type=Optional[Event],
+        idempotent=True,
     ),
     "event:delete": CommandSpec(
         command=COMMAND_DELETE_EVENT,
@@ -246,8 +364,14 @@ _CommandContextDependency = create_command_context_dependency(
 CommandContext = Annotated[LXMFCommandContext, Depends(_CommandContextDependency)]
 
 _SERVER_IDENTITY_FIELD = "server_identity_hash"
+_MISSING = object()
 _CONFIG_SOURCE_PATH: Optional[Path] = None
-_CONFIG_LOCK = Lock()
+_CONFIG_WRITE_PENDING: Optional[ConfigDict] = None
+_CONFIG_WRITE_WAITERS: List[asyncio.Future[None]] = []
+_CONFIG_WRITER_TASK: Optional[asyncio.Task[None]] = None
+# Reason: an update changes _CONFIG_STORE before its write and rolls back
+# after a failed one, so overlapping updates must not interleave.
+_CONFIG_UPDATE_LOCK = asyncio.Lock()
 
 
 def _load_gateway_config() -> ConfigDict:
@@ -261,8 +385,8 @@ def _load_gateway_config() -> ConfigDict:
     raw_json = os.getenv(CONFIG_JSON_ENV_VAR)
     if raw_json:
         try:
-            parsed = json.loads(raw_json)
-        except json.JSONDecodeError:
+            parsed = orjson.loads(raw_json)
+        except orjson.JSONDecodeError:
             parsed = None
         else:
             if isinstance(parsed, dict):
@@ -286,81 +410,83 @@ def _load_gateway_config() -> ConfigDict:
     return load_client_config(CONFIG_PATH)
 
 
-_CONFIG_DATA: ConfigDict = _load_gateway_config()
+_CONFIG_STORE: ConfigDict = _load_gateway_config()
+# Reason: readers share a live read-only view instead of copying the config;
+# only _update_server_identity writes, and it does so through _CONFIG_STORE.
+_CONFIG_DATA: ConfigView = MappingProxyType(_CONFIG_STORE)
 _DEFAULT_SERVER_IDENTITY: Optional[str] = read_server_identity_from_config(
-    _CONFIG_SOURCE_PATH or CONFIG_PATH, _CONFIG_DATA
+    _CONFIG_SOURCE_PATH or CONFIG_PATH, _CONFIG_STORE
+)
+# Reason: the config source is chosen once at import, so whether it can be
+# persisted (and where) never changes while the gateway runs.
+_CONFIG_MUTABLE: bool = _CONFIG_SOURCE_PATH is not None
+_CONFIG_PATH_TEXT: Optional[str] = (
+    str(_CONFIG_SOURCE_PATH) if _CONFIG_SOURCE_PATH else None
+)
+_IMMUTABLE_CONFIG_DETAIL = (
+    "Gateway configuration is sourced from environment variables and "
+    "cannot be modified at runtime."
 )
-_CLIENT_INSTANCE: Optional[LXMFClient] = None
+_LINK_DESTINATION_PREFIX: bytes = orjson.dumps(
+    {"configurable": _CONFIG_MUTABLE, "configPath": _CONFIG_PATH_TEXT}
+)[:-1]
 _GATEWAY_VERSION: str = _resolve_gateway_version()
-_START_TIME: datetime = datetime.now(timezone.utc)
+_START_MONOTONIC: float = time.monotonic()
+_START_TIME_ISO: str = datetime.now(timezone.utc).isoformat()
 _INTERFACE_STATUS: List[Dict[str, Any]] = []
+_INTERFACE_STATUS_JSON: bytes = b"[]"
+_INTERFACE_STATUS_TS: float = 0.0
+_STATUS_PREFIX: Optional[bytes] = None
 
 
-def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
-    """Return an ISO formatted timestamp in UTC when available."""
-
-    if value is None:
-        return None
-    return value.astimezone(timezone.utc).isoformat()
-
-
-@dataclass
-class _LinkStatus:
-    """Track the gateway's most recent LXMF link attempt."""
-
-    state: str = "pending"
-    message: Optional[str] = None
-    server_identity: Optional[str] = None
-    last_attempt: Optional[datetime] = None
-    last_success: Optional[datetime] = None
-    last_error: Optional[str] = None
-
-    def to_dict(self) -> Dict[str, Optional[str]]:
-        """Return a serialisable mapping describing the link state."""
-
-        return {
-            "state": self.state,
-            "message": self.message,
-            "serverIdentity": self.server_identity,
-            "lastAttempt": _format_timestamp(self.last_attempt),
-            "lastSuccess": _format_timestamp(self.last_success),
-            "lastError": self.last_error,
-        }
-
-
-_LINK_STATUS = _LinkStatus()
+_LINK_STATUS = LinkStatus()
 _LINK_TASK: Optional[asyncio.Task[None]] = None
 
 
-def _refresh_interface_status() -> List[Dict[str, Any]]:
-    """Refresh and cache the current Reticulum interface metadata."""
+def _force_refresh_interface_status() -> List[Dict[str, Any]]:
+    """Gather and cache the current Reticulum interface metadata."""
 
     global _INTERFACE_STATUS
+    global _INTERFACE_STATUS_JSON
+    global _INTERFACE_STATUS_TS
     _INTERFACE_STATUS = gather_interface_status()
+    # Reason: the snapshot is served to every poll within the TTL, so it is
+    # encoded once here rather than once per status response.
+    _INTERFACE_STATUS_JSON = orjson.dumps(_INTERFACE_STATUS)
+    _INTERFACE_STATUS_TS = time.monotonic()
     return _INTERFACE_STATUS
 
 
-def _normalise_optional_path(value: Optional[str]) -> Optional[str]:
-    """Return a stripped path string or ``None`` when empty."""
+def _refresh_interface_status() -> List[Dict[str, Any]]:
+    """Return cached interface metadata, gathering it again once stale."""
+
+    # Reason: status polls arrive in bursts from dashboards and monitors, so
+    # a short TTL collapses them into a single Reticulum introspection. An
+    # empty snapshot is never reused so interfaces show up as soon as
+    # Reticulum brings them online. The gather never yields to the loop, so
+    # concurrent polls cannot overlap a scan and need no single-flight future.
+    if (
+        _INTERFACE_STATUS
+        and time.monotonic() - _INTERFACE_STATUS_TS < _INTERFACE_STATUS_TTL_SECONDS
+    ):
+        return _INTERFACE_STATUS
+    return _force_refresh_interface_status()
 
-    if isinstance(value, str):
-        cleaned = value.strip()
-        return cleaned or None
-    return None
+
+def _normalise_optional(value: Optional[str]) -> Optional[str]:
+    """Return a stripped string or ``None`` when empty or not a string."""
+
+    return (value.strip() or None) if isinstance(value, str) else None
 
 
 def _normalise_optional_hex(value: Optional[str]) -> Optional[str]:
-    """Return a stripped hexadecimal string or ``None`` when empty."""
+    """Return a stripped lowercase hexadecimal string or ``None`` when empty."""
 
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if not cleaned:
-            return None
-        return cleaned.lower()
-    return None
+    cleaned = _normalise_optional(value)
+    return cleaned.lower() if cleaned else None
 
 
-def _is_shared_instance_rpc_enabled(config: ConfigDict) -> bool:
+def _is_shared_instance_rpc_enabled(config: ConfigView) -> bool:
     """Return True when shared-instance RPC access should be used."""
 
     flag = config.get(USE_SHARED_INSTANCE_RPC_KEY)
@@ -369,7 +495,7 @@ def _is_shared_instance_rpc_enabled(config: ConfigDict) -> bool:
     return bool(_normalise_optional_hex(config.get(SHARED_INSTANCE_RPC_KEY)))
 
 
-def _resolve_timeout(config: ConfigDict) -> float:
+def _resolve_timeout(config: ConfigView) -> float:
     """Return the timeout value configured for the client."""
 
     timeout_setting = config.get(REQUEST_TIMEOUT_KEY)
@@ -378,7 +504,7 @@ def _resolve_timeout(config: ConfigDict) -> float:
     return DEFAULT_TIMEOUT_SECONDS
 
 
-def _resolve_display_name(config: ConfigDict) -> str:
+def _resolve_display_name(config: ConfigView) -> str:
     """Return the configured display name or the default when missing."""
 
     display_name = config.get(CLIENT_DISPLAY_NAME_KEY)
@@ -390,12 +516,12 @@ def _resolve_display_name(config: ConfigDict) -> str:
 def _create_client_from_config() -> LXMFClient:
     """Instantiate the shared LXMF client based on configuration data."""
 
-    config_path_override = _normalise_optional_path(
+    config_path_override = _normalise_optional(
         _CONFIG_DATA.get(LXMF_CONFIG_PATH_KEY)
     )
     if config_path_override is None and DEFAULT_RETICULUM_CONFIG_PATH.exists():
         config_path_override = str(DEFAULT_RETICULUM_CONFIG_PATH.parent)
-    storage_path_override = _normalise_optional_path(
+    storage_path_override = _normalise_optional(
         _CONFIG_DATA.get(LXMF_STORAGE_PATH_KEY)
     )
     rpc_key_override = _normalise_optional_hex(
@@ -413,47 +539,95 @@ def _create_client_from_config() -> LXMFClient:
         timeout=timeout_seconds,
         shared_instance_rpc_key=rpc_key_override,
     )
-    client.announce()
     return client
 
 
-def _is_config_mutable() -> bool:
-    """Return ``True`` when the gateway configuration can be persisted."""
-
-    return _CONFIG_SOURCE_PATH is not None
-
-
 def _require_mutable_config() -> None:
     """Raise an HTTP error when runtime config updates are not allowed."""
 
-    if _is_config_mutable():
+    if _CONFIG_MUTABLE:
         return
+    # Reason: a fresh exception is raised each time because re-raising one
+    # shared instance would keep chaining tracebacks onto it.
     raise HTTPException(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        detail=(
-            "Gateway configuration is sourced from environment variables and "
-            "cannot be modified at runtime."
-        ),
+        status_code=_HTTP_503,
+        detail=_IMMUTABLE_CONFIG_DETAIL,
     )
 
 
-def _persist_gateway_config(data: ConfigDict) -> None:
-    """Write ``data`` to the backing client configuration JSON file."""
+async def _persist_gateway_config(data: ConfigDict) -> None:
+    """Write ``data`` to the backing client configuration JSON file.
+
+    The write runs in the default executor so disk latency never stalls the
+    event loop serving other gateway requests.
+    """
 
-    if _CONFIG_SOURCE_PATH is None:
+    config_path = _CONFIG_SOURCE_PATH
+    if config_path is None:
         raise RuntimeError("Gateway configuration source is not writable")
-    write_client_config(data, _CONFIG_SOURCE_PATH)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, write_client_config, data, config_path)
 
 
-def _link_destination_payload() -> Dict[str, Any]:
-    """Return a serialisable description of the active link destination."""
+async def _config_writer() -> None:
+    """Write the latest pending configuration until no update is queued."""
 
-    return {
-        "serverIdentity": _DEFAULT_SERVER_IDENTITY,
-        "configurable": _is_config_mutable(),
-        "configPath": str(_CONFIG_SOURCE_PATH) if _CONFIG_SOURCE_PATH else None,
-        "linkStatus": _LINK_STATUS.to_dict(),
-    }
+    global _CONFIG_WRITE_PENDING
+    while _CONFIG_WRITE_PENDING is not None:
+        # Reason: the executor thread needs a stable snapshot, and copying here
+        # costs one copy per coalesced write rather than one per update.
+        data = dict(_CONFIG_WRITE_PENDING)
+        waiters = list(_CONFIG_WRITE_WAITERS)
+        _CONFIG_WRITE_PENDING = None
+        _CONFIG_WRITE_WAITERS.clear()
+        try:
+            await _persist_gateway_config(data)
+        except Exception as exc:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+
+async def _write_gateway_config(data: ConfigDict) -> None:
+    """Persist ``data`` through the single config writer.
+
+    Updates that arrive while a write is in flight are coalesced, so only the
+    newest configuration is written next and every caller waits for it.
+
+    Raises:
+        RuntimeError: If the configuration source is not writable.
+    """
+
+    global _CONFIG_WRITE_PENDING
+    global _CONFIG_WRITER_TASK
+    loop = asyncio.get_running_loop()
+    waiter: asyncio.Future[None] = loop.create_future()
+    _CONFIG_WRITE_PENDING = data
+    _CONFIG_WRITE_WAITERS.append(waiter)
+    if _CONFIG_WRITER_TASK is None or _CONFIG_WRITER_TASK.done():
+        _CONFIG_WRITER_TASK = loop.create_task(_config_writer())
+    await waiter
+
+
+def _encode_link_destination() -> bytes:
+    """Return the JSON description of the active link destination.
+
+    The fixed ``configurable`` and ``configPath`` fields come from
+    ``_LINK_DESTINATION_PREFIX``; only the identity and link status are
+    encoded per call.
+    """
+
+    dynamic_fields = orjson.dumps(
+        {
+            "serverIdentity": _DEFAULT_SERVER_IDENTITY,
+            "linkStatus": _LINK_STATUS.to_dict(),
+        }
+    )
+    return _LINK_DESTINATION_PREFIX + b"," + dynamic_fields[1:]
 
 
 async def _restart_link_task(server_identity: Optional[str]) -> None:
@@ -485,100 +659,159 @@ async def _restart_link_task(server_identity: Optional[str]) -> None:
     )
 
 
-def _update_server_identity(server_identity: Optional[str]) -> None:
+async def _update_server_identity(server_identity: Optional[str]) -> None:
     """Persist ``server_identity`` into the shared configuration."""
 
-    global _CONFIG_DATA
     global _DEFAULT_SERVER_IDENTITY
 
-    with _CONFIG_LOCK:
-        updated = dict(_CONFIG_DATA)
+    async with _CONFIG_UPDATE_LOCK:
+        previous = _CONFIG_STORE.get(_SERVER_IDENTITY_FIELD, _MISSING)
         if server_identity is None:
-            updated.pop(_SERVER_IDENTITY_FIELD, None)
+            _CONFIG_STORE.pop(_SERVER_IDENTITY_FIELD, None)
         else:
-            updated[_SERVER_IDENTITY_FIELD] = server_identity
+            _CONFIG_STORE[_SERVER_IDENTITY_FIELD] = server_identity
 
         try:
-            _persist_gateway_config(updated)
+            await _write_gateway_config(_CONFIG_STORE)
         except RuntimeError as exc:
+            if previous is _MISSING:
+                _CONFIG_STORE.pop(_SERVER_IDENTITY_FIELD, None)
+            else:
+                _CONFIG_STORE[_SERVER_IDENTITY_FIELD] = previous
             raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                status_code=_HTTP_503,
                 detail=str(exc),
             ) from exc
 
-        _CONFIG_DATA = updated
         _DEFAULT_SERVER_IDENTITY = server_identity
-        if server_identity:
-            logger.info("Gateway link destination updated to %s", server_identity)
-        else:
-            logger.info("Gateway link destination cleared")
+    if server_identity:
+        logger.info("Gateway link destination updated to %s", server_identity)
+    else:
+        logger.info("Gateway link destination cleared")
 
 
 def get_shared_client() -> LXMFClient:
-    """Return the shared LXMF client, creating it if necessary."""
+    """Return the shared LXMF client, creating and announcing it if necessary."""
+
+    return _CLIENT_MANAGER.get_client()
 
-    global _CLIENT_INSTANCE
-    if _CLIENT_INSTANCE is None:
-        _CLIENT_INSTANCE = _create_client_from_config()
-    return _CLIENT_INSTANCE
 
+_LINK_MANAGER = LinkManager(
+    get_shared_client,
+    keepalive_interval_seconds=_LINK_KEEPALIVE_INTERVAL_SECONDS,
+)
 
-def _record_link_failure(server_identity: str, error: Exception) -> None:
+
+def _record_link_failure(
+    server_identity: str, error: Exception, retry_delay_seconds: float
+) -> None:
     """Update the link status after a failed connection attempt."""
 
-    _LINK_STATUS.state = "connecting"
-    _LINK_STATUS.last_error = str(error)
-    _LINK_STATUS.message = (
-        "Link to LXMF server "
-        f"{server_identity} failed: {error}. "
-        f"Retrying in {_LINK_RETRY_DELAY_SECONDS:.1f} seconds."
+    _LINK_STATUS.record_failure(error, retry_delay_seconds)
+    logger.warning(
+        "LXMF link to server %s failed: %s; retrying in %.1fs",
+        server_identity,
+        error,
+        retry_delay_seconds,
     )
-    logger.warning("LXMF link to server %s failed: %s", server_identity, error)
 
 
-def _record_link_success(server_identity: str, attempt_time: datetime) -> None:
+def _record_link_success(server_identity: str, attempt_time: str) -> None:
     """Update link status and log a successful connection."""
 
     _LINK_STATUS.state = "connected"
     _LINK_STATUS.last_success = attempt_time
     _LINK_STATUS.last_error = None
-    message = f"Connected to LXMF server {server_identity}"
-    _LINK_STATUS.message = message
-    print(f"[Emergency Gateway] {message}")
-    logger.info("Established LXMF link with server %s", server_identity)
+    _LINK_STATUS.message = f"Connected to LXMF server {server_identity}"
+    logger.info("[Emergency Gateway] Connected to LXMF server %s", server_identity)
 
 
 async def _ensure_link_with_retry(client: LXMFClient, server_identity: str) -> None:
     """Continuously attempt to connect the LXMF client to the server."""
 
+    delay = _LINK_INITIAL_RETRY_DELAY_SECONDS
     while True:
-        attempt_time = datetime.now(timezone.utc)
+        attempt_time = datetime.now(timezone.utc).isoformat()
         _LINK_STATUS.last_attempt = attempt_time
         try:
             await client.ensure_link(server_identity)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
-            _record_link_failure(server_identity, exc)
-            await asyncio.sleep(_LINK_RETRY_DELAY_SECONDS)
+            # Reason: back off exponentially with jitter so transient failures
+            # retry quickly without gateways reconnecting in lockstep.
+            wait = delay + random.uniform(0, 0.5 * delay)
+            _record_link_failure(server_identity, exc, wait)
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, _LINK_RETRY_DELAY_SECONDS)
         else:
             _record_link_success(server_identity, attempt_time)
             break
 
 
+def _build_status_prefix() -> bytes:
+    """Return the encoded status fields that stay fixed for the process lifetime.
+
+    The JSON object is returned without its closing brace so per-request
+    fields can be appended to it.
+    """
+
+    settings = _CLIENT_MANAGER.get_settings()
+    static_fields = {
+        "version": _GATEWAY_VERSION,
+        "startedAt": _START_TIME_ISO,
+        "clientDisplayName": settings.client_display_name,
+        "requestTimeoutSeconds": settings.request_timeout_seconds,
+        "lxmfConfigPath": settings.lxmf_config_path or str(CONFIG_PATH),
+        "lxmfStoragePath": settings.lxmf_storage_path,
+        "allowedOrigins": _ALLOWED_ORIGINS,
+    }
+    return orjson.dumps(static_fields)[:-1]
+
+
 def _format_uptime(uptime_seconds: float) -> str:
     """Format seconds since startup as an ``HH:MM:SS`` string."""
 
-    total_seconds = int(max(uptime_seconds, 0))
+    return _format_whole_seconds(int(max(uptime_seconds, 0)))
+
+
+# Reason: uptime advances once a second, so polls landing within the same
+# second reuse the previous string.
+@lru_cache(maxsize=1)
+def _format_whole_seconds(total_seconds: int) -> str:
+    """Format whole seconds as an ``HH:MM:SS`` string."""
+
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
-@app.on_event("startup")
+def _enable_eager_tasks(loop: asyncio.AbstractEventLoop) -> bool:
+    """Install the eager task factory on ``loop`` when the runtime supports it.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): Event loop serving the gateway.
+
+    Returns:
+        bool: ``True`` when the eager task factory was installed.
+    """
+
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is None:
+        return False
+    # Reason: link retries and notification fan-out often finish without
+    # suspending, so running them eagerly skips a loop round-trip per task.
+    loop.set_task_factory(eager_factory)
+    return True
+
+
 async def _startup() -> None:
     """Ensure the LXMF client is ready before serving requests."""
 
+    _mp_compat.install()
+    _enable_eager_tasks(asyncio.get_running_loop())
+    global _STATUS_PREFIX
+    _STATUS_PREFIX = _build_status_prefix()
     client = get_shared_client()
     global _NOTIFICATION_UNSUBSCRIBER
     if _NOTIFICATION_UNSUBSCRIBER is None and hasattr(
@@ -588,20 +821,21 @@ async def _startup() -> None:
             _NOTIFICATION_UNSUBSCRIBER = await attach_client_notifications(client)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("Failed to attach LXMF notification listener: %s", exc)
-    interface_status = _refresh_interface_status()
+    interface_status = _force_refresh_interface_status()
     active_interfaces = [
         status["name"] for status in interface_status if status.get("online")
     ]
     if active_interfaces:
-        joined = ", ".join(active_interfaces)
-        print(f"[Emergency Gateway] Active Reticulum interfaces: {joined}")
+        logger.info(
+            "[Emergency Gateway] Active Reticulum interfaces: %s",
+            ", ".join(active_interfaces),
+        )
     else:
-        print("[Emergency Gateway] No active Reticulum interfaces reported.")
+        logger.info("[Emergency Gateway] No active Reticulum interfaces reported.")
 
     _LINK_MANAGER.start(get_server_identity())
 
 
-@app.on_event("shutdown")
 async def _shutdown() -> None:
     """Tear down background tasks on application shutdown."""
 
@@ -613,31 +847,43 @@ async def _shutdown() -> None:
         finally:
             _NOTIFICATION_UNSUBSCRIBER = None
     await _CLIENT_MANAGER.shutdown()
-    global _CLIENT_INSTANCE
-    _CLIENT_INSTANCE = None
 
 
-@app.get("/")
-async def get_gateway_status() -> Dict[str, Any]:
+# Reason: the model documents the payload in OpenAPI only; the handler still
+# splices pre-encoded bytes, so no per-request validation or encode pass runs.
+@app.get("/", response_model=None, responses={200: {"model": GatewayStatus}})
+async def get_gateway_status() -> Response:
     """Return gateway metadata and configuration details."""
 
-    uptime_seconds = (datetime.now(timezone.utc) - _START_TIME).total_seconds()
-    settings = _CLIENT_MANAGER.get_settings()
-    server_identity = get_server_identity()
-    interface_status = _refresh_interface_status()
-
-    return {
-        "version": _GATEWAY_VERSION,
-        "uptime": _format_uptime(uptime_seconds),
-        "serverIdentity": server_identity,
-        "clientDisplayName": settings.client_display_name,
-        "requestTimeoutSeconds": settings.request_timeout_seconds,
-        "lxmfConfigPath": settings.lxmf_config_path or str(CONFIG_PATH),
-        "lxmfStoragePath": settings.lxmf_storage_path,
-        "allowedOrigins": _ALLOWED_ORIGINS,
-        "linkStatus": _LINK_MANAGER.status.to_dict(),
-        "reticulumInterfaces": interface_status,
-    }
+    uptime_seconds = time.monotonic() - _START_MONOTONIC
+    status_prefix = _STATUS_PREFIX
+    if status_prefix is None:
+        status_prefix = _build_status_prefix()
+
+    _refresh_interface_status()
+    dynamic_fields = orjson.dumps(
+        {
+            "uptime": _format_uptime(uptime_seconds),
+            "serverIdentity": get_server_identity(),
+            "linkStatus": _LINK_MANAGER.status.to_dict(),
+        }
+    )
+    # Reason: the static fields are encoded once at startup and the interface
+    # list once per refresh, so each poll only encodes the changing fields and
+    # splices them between the cached fragments.
+    return Response(
+        content=b"".join(
+            (
+                status_prefix,
+                b",",
+                dynamic_fields[1:-1],
+                b',"reticulumInterfaces":',
+                _INTERFACE_STATUS_JSON,
+                b"}",
+            )
+        ),
+        media_type="application/json",
+    )
 
 
 def _extract_server_identity(payload: Dict[str, Any]) -> str:
@@ -646,50 +892,55 @@ def _extract_server_identity(payload: Dict[str, Any]) -> str:
     candidate = payload.get("serverIdentity")
     if candidate is None:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=_HTTP_422,
             detail="serverIdentity is required",
         )
     try:
         return LXMFClient._normalise_destination_hex(str(candidate))
     except (TypeError, ValueError) as exc:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=_HTTP_422,
             detail=str(exc),
         ) from exc
 
 
-async def _persist_link_destination(
-    server_identity: Optional[str],
-) -> Dict[str, Any]:
+async def _persist_link_destination(server_identity: Optional[str]) -> bytes:
     """Persist ``server_identity`` and refresh link state."""
 
     _require_mutable_config()
-    _update_server_identity(server_identity)
+    await _update_server_identity(server_identity)
     await _restart_link_task(server_identity)
-    return _link_destination_payload()
+    return _encode_link_destination()
 
 
 @app.get("/link-destination")
-async def get_link_destination() -> Dict[str, Any]:
+async def get_link_destination() -> Response:
     """Return the currently configured LXMF link destination."""
 
-    return _link_destination_payload()
+    return Response(content=_encode_link_destination(), media_type="application/json")
 
 
 @app.post("/link-destination", status_code=status.HTTP_201_CREATED)
-async def create_link_destination(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def create_link_destination(payload: Dict[str, Any]) -> Response:
     """Create a new default link destination for the gateway."""
 
     server_identity = _extract_server_identity(payload)
-    return await _persist_link_destination(server_identity)
+    return Response(
+        content=await _persist_link_destination(server_identity),
+        status_code=_HTTP_201,
+        media_type="application/json",
+    )
 
 
 @app.put("/link-destination")
-async def update_link_destination(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def update_link_destination(payload: Dict[str, Any]) -> Response:
     """Update the default link destination for the gateway."""
 
     server_identity = _extract_server_identity(payload)
-    return await _persist_link_destination(server_identity)
+    return Response(
+        content=await _persist_link_destination(server_identity),
+        media_type="application/json",
+    )
 
 
 @app.delete("/link-destination", status_code=status.HTTP_204_NO_CONTENT)
@@ -697,132 +948,197 @@ async def delete_link_destination() -> Response:
     """Clear the stored link destination value."""
 
     await _persist_link_destination(None)
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-
-async def _resolve_server_identity(
-    server_identity_query: Optional[str] = Query(None, alias="server_identity"),
-    server_identity_header: Optional[str] = Header(None, alias="X-Server-Identity"),
-) -> str:
-    """Determine the destination server identity hash for a request."""
-
-    candidate = (
-        server_identity_query or server_identity_header or _DEFAULT_SERVER_IDENTITY
-    )
-    if candidate is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Server identity hash is required",
-        )
-    try:
-        return LXMFClient._normalise_destination_hex(candidate)
-    except (TypeError, ValueError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(exc),
-        ) from exc
-
-
-@app.post("/emergency-action-messages")
-async def create_emergency_action_message(
-    payload: Dict[str, Any],
-    context: CommandContext,
-) -> JSONResponse:
-    """Create a new emergency action message via LXMF."""
-
-    return await context.execute("eam:create", body=payload)
-
-
-@app.delete("/emergency-action-messages/{callsign}")
-async def delete_emergency_action_message(
-    callsign: str,
-    context: CommandContext,
-) -> JSONResponse:
-    """Delete an emergency action message by callsign."""
-
-    return await context.execute("eam:delete", payload=callsign)
-
+    return Response(status_code=_HTTP_204)
+
+
+@dataclass(frozen=True)
+class _CommandRoute:
+    """Describe an HTTP route that forwards to a command in ``_COMMAND_SPECS``."""
+
+    method: str
+    path: str
+    spec_key: str
+    name: str
+    description: str
+    body_model: Optional[Type[BaseModel]] = None
+    path_param: Optional[str] = None
+    path_type: type = str
+
+
+_COMMAND_ROUTES: Tuple[_CommandRoute, ...] = (
+    _CommandRoute(
+        "POST",
+        "/emergency-action-messages",
+        "eam:create",
+        "create_emergency_action_message",
+        "Create a new emergency action message via LXMF.",
+        body_model=EmergencyActionMessageBody,
+    ),
+    _CommandRoute(
+        "DELETE",
+        "/emergency-action-messages/{callsign}",
+        "eam:delete",
+        "delete_emergency_action_message",
+        "Delete an emergency action message by callsign.",
+        path_param="callsign",
+    ),
+    _CommandRoute(
+        "GET",
+        "/emergency-action-messages",
+        "eam:list",
+        "list_emergency_action_messages",
+        "List emergency action messages stored on the server.",
+    ),
+    _CommandRoute(
+        "PUT",
+        "/emergency-action-messages/{callsign}",
+        "eam:update",
+        "update_emergency_action_message",
+        "Update an existing emergency action message.",
+        body_model=EmergencyActionMessageUpdateBody,
+        path_param="callsign",
+    ),
+    _CommandRoute(
+        "GET",
+        "/emergency-action-messages/{callsign}",
+        "eam:retrieve",
+        "retrieve_emergency_action_message",
+        "Retrieve an emergency action message by callsign.",
+        path_param="callsign",
+    ),
+    _CommandRoute(
+        "POST",
+        "/events",
+        "event:create",
+        "create_event",
+        "Create a new event record via LXMF.",
+        body_model=EventBody,
+    ),
+    _CommandRoute(
+        "DELETE",
+        "/events/{uid}",
+        "event:delete",
+        "delete_event",
+        "Delete an event by unique identifier.",
+        path_param="uid",
+    ),
+    _CommandRoute(
+        "GET",
+        "/events",
+        "event:list",
+        "list_events",
+        "List events stored on the server.",
+    ),
+    _CommandRoute(
+        "PUT",
+        "/events/{uid}",
+        "event:update",
+        "update_event",
+        "Update an existing event by unique identifier.",
+        body_model=EventUpdateBody,
+        path_param="uid",
+        path_type=int,
+    ),
+    _CommandRoute(
+        "GET",
+        "/events/{uid}",
+        "event:retrieve",
+        "retrieve_event",
+        "Retrieve an event by unique identifier.",
+        path_param="uid",
+    ),
+)
 
-@app.get("/emergency-action-messages")
-async def list_emergency_action_messages(
-    context: CommandContext,
-) -> JSONResponse:
-    """List emergency action messages stored on the server."""
 
-    return await context.execute("eam:list")
+def _build_command_endpoint(
+    route: _CommandRoute,
+) -> Callable[..., Awaitable[JSONResponse]]:
+    """Return an endpoint that forwards ``route`` to its command spec.
 
+    Args:
+        route (_CommandRoute): Route description to build the endpoint for.
 
-@app.put("/emergency-action-messages/{callsign}")
-async def update_emergency_action_message(
-    callsign: str,
-    payload: Dict[str, Any],
-    context: CommandContext,
-) -> JSONResponse:
-    """Update an existing emergency action message."""
+    Returns:
+        Callable[..., Awaitable[JSONResponse]]: Endpoint whose signature
+        declares the path parameter, body model and command context so that
+        FastAPI validates and documents them as for a hand-written handler.
+    """
 
-    return await context.execute(
-        "eam:update", body=payload, path_params={"callsign": callsign}
+    # Reason: resolving the spec here keeps the key lookup out of the request
+    # path and fails at import if a route names an unknown command.
+    spec = _COMMAND_SPECS[route.spec_key]
+    path_param = route.path_param
+    has_body = route.body_model is not None
+
+    async def endpoint(context: LXMFCommandContext, **kwargs: Any) -> JSONResponse:
+        body = kwargs.get("payload") if has_body else None
+        if path_param is None:
+            return await context.execute_spec(spec, body=body)
+        path_value = kwargs[path_param]
+        if has_body:
+            return await context.execute_spec(
+                spec, body=body, path_params={path_param: path_value}
+            )
+        return await context.execute_spec(spec, payload=path_value)
+
+    parameters = []
+    if path_param is not None:
+        parameters.append(
+            inspect.Parameter(
+                path_param,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=route.path_type,
+            )
+        )
+    if has_body:
+        parameters.append(
+            inspect.Parameter(
+                "payload",
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=route.body_model,
+            )
+        )
+    parameters.append(
+        inspect.Parameter(
+            "context",
+            inspect.Parameter.KEYWORD_ONLY,
+            annotation=CommandContext,
+        )
+    )
+    # Reason: FastAPI reads the dependant from ``inspect.signature``, so the
+    # generated signature stands in for the keyword arguments of a handler.
+    endpoint.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        parameters, return_annotation=JSONResponse
+    )
+    endpoint.__name__ = route.name
+    endpoint.__qualname__ = route.name
+    endpoint.__doc__ = route.description
+    return endpoint
+
+
+for _route in _COMMAND_ROUTES:
+    app.add_api_route(
+        _route.path,
+        _build_command_endpoint(_route),
+        methods=[_route.method],
+        name=_route.name,
     )
 
 
-@app.get("/emergency-action-messages/{callsign}")
-async def retrieve_emergency_action_message(
-    callsign: str,
-    context: CommandContext,
-) -> JSONResponse:
-    """Retrieve an emergency action message by callsign."""
-
-    return await context.execute("eam:retrieve", payload=callsign)
-
-
-@app.post("/events")
-async def create_event(
-    payload: Dict[str, Any],
-    context: CommandContext,
-) -> JSONResponse:
-    """Create a new event record via LXMF."""
-
-    return await context.execute("event:create", body=payload)
-
-
-@app.delete("/events/{uid}")
-async def delete_event(
-    uid: str,
-    context: CommandContext,
-) -> JSONResponse:
-    """Delete an event by unique identifier."""
-
-    return await context.execute("event:delete", payload=uid)
-
-
-@app.get("/events")
-async def list_events(
-    context: CommandContext,
-) -> JSONResponse:
-    """List events stored on the server."""
-
-    return await context.execute("event:list")
-
-
-@app.put("/events/{uid}")
-async def update_event(
-    uid: int,
-    payload: Dict[str, Any],
-    context: CommandContext,
-) -> JSONResponse:
-    """Update an existing event by unique identifier."""
-
-    return await context.execute("event:update", body=payload, path_params={"uid": uid})
-
-
-@app.get("/events/{uid}")
-async def retrieve_event(
-    uid: str,
-    context: CommandContext,
-) -> JSONResponse:
-    """Retrieve an event by unique identifier."""
+__all__ = ["app"]
 
-    return await context.execute("event:retrieve", payload=uid)
 
+if __name__ == "__main__":  # pragma: no cover - manual launcher
+    import uvicorn
 
-__all__ = ["app"]
+    _loop_implementation = "asyncio"
+    if sys.platform != "win32":
+        try:
+            import uvloop  # type: ignore # noqa: F401
+        except ImportError:
+            pass
+        else:
+            # Reason: the gateway mostly brokers HTTP <-> LXMF round-trips, so
+            # the libuv based loop lowers per-task and per-socket overhead.
+            _loop_implementation = "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=_loop_implementation)
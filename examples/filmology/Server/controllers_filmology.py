@@ -1,14 +1,49 @@
-from dataclasses import asdict
+from typing import Any
+from typing import Mapping
+from typing import Optional
 
+from reticulum_openapi.controller import APIException
 from reticulum_openapi.controller import Controller
 from reticulum_openapi.controller import handle_exceptions
+from reticulum_openapi.sqlalchemy_controller import SQLAlchemyControllerMixin
+from reticulum_openapi.sqlalchemy_controller import SessionFactory
 
-from .database import async_session
+from . import database
 from .models_filmology import Movie
 
 
-class MovieController(Controller):
-    """Handlers for movie operations."""
+def _page_value(page: Mapping[str, Any], key: str) -> Optional[int]:
+    """Return the non-negative integer paging value stored under ``key``.
+
+    Raises:
+        APIException: If the value is not a non-negative integer.
+    """
+
+    value = page.get(key)
+    if value is None:
+        return None
+    try:
+        if isinstance(value, bool):
+            raise TypeError(key)
+        number = int(value)
+    except (TypeError, ValueError):
+        raise APIException(f"'{key}' must be an integer", 400) from None
+    if number < 0:
+        raise APIException(f"'{key}' must not be negative", 400)
+    return number
+
+
+class MovieController(SQLAlchemyControllerMixin, Controller):
+    """Handlers for movie operations.
+
+    Sessions come from the injected ``session_factory`` when one is given and
+    from the shared :data:`database.async_session` pool otherwise.
+    """
+
+    def get_default_session_factory(self) -> Optional[SessionFactory]:
+        """Return the configured async session factory from the database module."""
+
+        return database.async_session
 
     @handle_exceptions
     async def CreateMovie(self, req: dict):
@@ -23,9 +58,7 @@ class MovieController(Controller):
         movie = Movie(
             **{k: v for k, v in req.items() if k in Movie.__dataclass_fields__}
         )
-        async with async_session() as session:
-            await Movie.create(session, **asdict(movie))
-        return movie
+        return await self._create_instance(Movie, movie)
 
     @handle_exceptions
     async def RetrieveMovie(self, movie_id: int):
@@ -37,9 +70,7 @@ class MovieController(Controller):
         Returns:
             Movie | None: Retrieved record or None.
         """
-        async with async_session() as session:
-            item = await Movie.get(session, movie_id)
-        return item
+        return await self._retrieve_instance(Movie, movie_id)
 
     @handle_exceptions
     async def DeleteMovie(self, movie_id: int):
@@ -51,20 +82,29 @@ class MovieController(Controller):
         Returns:
             dict: Deletion status.
         """
-        async with async_session() as session:
-            deleted = await Movie.delete(session, movie_id)
+        deleted = await self._delete_instance(Movie, movie_id)
         return {"status": "deleted" if deleted else "not_found", "id": movie_id}
 
     @handle_exceptions
-    async def ListMovie(self):
-        """List all movies.
+    async def ListMovie(self, req: Optional[dict] = None):
+        """List stored movies, optionally one page at a time.
+
+        Args:
+            req (Optional[dict]): Optional ``skip`` and ``limit`` values
+                selecting a page ordered by movie id.
 
         Returns:
             list[Movie]: Stored movies.
+
+        Raises:
+            APIException: If ``skip`` or ``limit`` is not a non-negative integer.
         """
-        async with async_session() as session:
-            items = await Movie.list(session)
-        return items
+        page = req or {}
+        return await self._list_instances(
+            Movie,
+            limit=_page_value(page, "limit"),
+            offset=_page_value(page, "skip"),
+        )
 
     @handle_exceptions
     async def PatchMovie(self, req: dict):
@@ -79,6 +119,4 @@ class MovieController(Controller):
         movie = Movie(
             **{k: v for k, v in req.items() if k in Movie.__dataclass_fields__}
         )
-        async with async_session() as session:
-            updated = await Movie.update(session, movie.id, **asdict(movie))
-        return updated
+        return await self._update_instance(Movie, movie)
@@ -2,6 +2,8 @@
 
 import sys as _sys
 
+__version__ = "0.1.0"
+
 from . import logging_config as _logging_config
 from .announcer import DestinationAnnouncer
 from .controller import APIException
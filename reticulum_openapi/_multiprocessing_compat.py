@@ -8,6 +8,9 @@ already been set`` which prevents the application from starting.
 
 To keep the gateway usable we intercept repeated ``set_start_method`` calls and
 silently ignore attempts to change the method after it has been initialised.
+Call :func:`install` to enable the guard and :func:`uninstall` to restore the
+original function. Importing this module changes nothing; ``LXMFService.start``
+and the example gateway's startup install the guard.
 """
 
 from __future__ import annotations
@@ -49,4 +52,13 @@ def _safe_set_start_method(method: str, /, *args: Any, **kwargs: Any) -> Any:
         return None
 
 
-multiprocessing.set_start_method = _safe_set_start_method  # type: ignore[assignment]
+def install() -> None:
+    """Route ``multiprocessing.set_start_method`` through the duplicate guard."""
+
+    multiprocessing.set_start_method = _safe_set_start_method  # type: ignore[assignment]
+
+
+def uninstall() -> None:
+    """Restore the original ``multiprocessing.set_start_method``."""
+
+    multiprocessing.set_start_method = _ORIGINAL_SET_START_METHOD
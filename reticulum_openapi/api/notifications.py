@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
+import logging
+from collections import deque
 from dataclasses import asdict
 from dataclasses import is_dataclass
 from typing import Any
@@ -12,64 +12,166 @@ from typing import AsyncGenerator
 from typing import Awaitable
 from typing import Callable
 from typing import Dict
-from typing import Set
+from typing import Optional
+from typing import Tuple
 
+import orjson
 from fastapi import APIRouter
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 
+try:
+    import pybase64 as base64  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    import base64
+
 from ..client import LXMFClient
 from ..codec_msgpack import CodecError
 from ..codec_msgpack import decode_payload_bytes
 
 
+logger = logging.getLogger(__name__)
+
+_SSE_BATCH_LIMIT = 32
+_DROP_LOG_INTERVAL = 100
+_SSE_KEEPALIVE_SECONDS = 15.0
+_SSE_KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
+def _encode_binary(value: Any) -> str:
+    """Return binary values as base64 text for ``orjson.dumps``."""
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_sse_frame(message: Dict[str, Any]) -> bytes:
+    """Return ``message`` encoded as a complete Server-Sent Events frame.
+
+    orjson serialises dataclasses and non-string keys natively and calls
+    :func:`_encode_binary` for bytes, so decoded payloads need no separate
+    normalisation pass. Messages orjson still rejects, such as maps keyed by
+    bytes, are normalised first.
+    """
+
+    try:
+        body = orjson.dumps(
+            message, default=_encode_binary, option=orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        body = orjson.dumps(_normalise_payload(message))
+    return b"data: " + body + b"\n\n"
+
+
+class NotificationSubscriber:
+    """Bounded buffer of SSE frames waiting to be sent to one client.
+
+    When the buffer is full the oldest frame is discarded, so a slow client
+    only ever falls behind by ``maxlen`` notifications. A ``maxlen`` of zero
+    or less leaves the buffer unbounded, as ``asyncio.Queue`` does.
+    """
+
+    __slots__ = ("_frames", "_ready", "_dropped")
+
+    def __init__(self, maxlen: int):
+        self._frames: deque = deque(maxlen=maxlen if maxlen > 0 else None)
+        self._ready = asyncio.Event()
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Return how many frames were discarded because the buffer was full."""
+
+        return self._dropped
+
+    def push(self, frame: bytes) -> None:
+        """Buffer ``frame`` and wake the waiting stream."""
+
+        maxlen = self._frames.maxlen
+        if maxlen is not None and len(self._frames) == maxlen:
+            self._dropped += 1
+            if self._dropped % _DROP_LOG_INTERVAL == 1:
+                logger.warning(
+                    "Notification subscriber is falling behind; %d frames dropped",
+                    self._dropped,
+                )
+        self._frames.append(frame)
+        self._ready.set()
+
+    def get_nowait(self) -> bytes:
+        """Return the oldest buffered frame.
+
+        Raises:
+            asyncio.QueueEmpty: If no frame is buffered.
+        """
+
+        if not self._frames:
+            raise asyncio.QueueEmpty
+        return self._frames.popleft()
+
+    async def get(self) -> bytes:
+        """Wait for and return the oldest buffered frame."""
+
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
+
 class NotificationHub:
     """Manage SSE subscribers and broadcast notification payloads."""
 
     def __init__(self, queue_size: int = 32):
         self._queue_size = queue_size
-        self._lock = asyncio.Lock()
-        self._subscribers: Set[asyncio.Queue[str]] = set()
-
-    async def add_subscriber(self) -> asyncio.Queue[str]:
-        """Register a new subscriber queue for notification delivery."""
-
-        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
-        async with self._lock:
-            self._subscribers.add(queue)
+        # Reason: every hub method runs on the event loop without awaiting, so
+        # rebinding an immutable tuple replaces the lock and the snapshot copy
+        # that broadcasts previously took.
+        self._subscribers: Tuple[NotificationSubscriber, ...] = ()
+
+    async def add_subscriber(
+        self, queue_size: Optional[int] = None
+    ) -> NotificationSubscriber:
+        """Register a new subscriber for notification delivery.
+
+        Args:
+            queue_size (Optional[int]): Frames buffered for this subscriber
+                before the oldest are dropped. Defaults to the hub's size;
+                zero or less leaves the buffer unbounded, like the hub's own
+                ``queue_size``.
+
+        Returns:
+            NotificationSubscriber: The registered subscriber.
+        """
+
+        queue = NotificationSubscriber(
+            self._queue_size if queue_size is None else queue_size
+        )
+        self._subscribers = self._subscribers + (queue,)
         return queue
 
-    async def remove_subscriber(self, queue: asyncio.Queue[str]) -> None:
+    async def remove_subscriber(self, queue: NotificationSubscriber) -> None:
         """Remove a subscriber queue from the broadcast list."""
 
-        async with self._lock:
-            self._subscribers.discard(queue)
+        self._subscribers = tuple(
+            subscriber for subscriber in self._subscribers if subscriber is not queue
+        )
 
     async def broadcast(self, message: Dict[str, Any]) -> None:
-        """Publish a notification to all active subscribers."""
-
-        payload = json.dumps(message)
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            try:
-                queue.put_nowait(payload)
-            except asyncio.QueueFull:
-                try:
-                    _ = queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    queue.put_nowait(payload)
-                except asyncio.QueueFull:
-                    # Skip unresponsive subscriber
-                    continue
+        """Publish a notification to all active subscribers.
+
+        The SSE frame is encoded once and the same bytes object is queued for
+        every subscriber.
+        """
+
+        payload = _encode_sse_frame(message)
+        for queue in self._subscribers:
+            queue.push(payload)
 
     async def reset(self) -> None:
         """Remove all known subscribers."""
 
-        async with self._lock:
-            self._subscribers.clear()
+        self._subscribers = ()
 
 
 notification_hub = NotificationHub()
@@ -79,6 +181,8 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 def _normalise_payload(value: Any) -> Any:
     """Convert dataclasses and binary blobs into JSON-safe structures."""
 
+    if value is None or isinstance(value, (str, int, float)):
+        return value
     if is_dataclass(value):
         return _normalise_payload(asdict(value))
     if isinstance(value, dict):
@@ -91,7 +195,7 @@ def _normalise_payload(value: Any) -> Any:
 
 
 def _decode_payload(payload: bytes) -> Dict[str, Any]:
-    """Decode LXMF payloads into JSON serialisable structures."""
+    """Decode LXMF payloads for :func:`_encode_sse_frame` to serialise."""
 
     if not payload:
         return {"payload": None, "payload_raw": ""}
@@ -102,25 +206,62 @@ def _decode_payload(payload: bytes) -> Dict[str, Any]:
     except CodecError:
         return {"payload": None, "payload_raw": encoded}
 
-    normalised = _normalise_payload(decoded)
-    return {"payload": normalised, "payload_raw": encoded}
+    return {"payload": decoded, "payload_raw": encoded}
 
 
-async def _event_stream(
-    request: Request, queue: asyncio.Queue[str]
-) -> AsyncGenerator[str, None]:
-    """Yield Server-Sent Events until the client disconnects."""
+async def _wait_for_disconnect(request: Request) -> None:
+    """Return once the ASGI server reports that the client disconnected."""
 
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _event_stream(
+    request: Request,
+    queue: NotificationSubscriber,
+    keepalive_seconds: float = _SSE_KEEPALIVE_SECONDS,
+) -> AsyncGenerator[bytes, None]:
+    """Yield Server-Sent Events until the client disconnects.
+
+    A comment line is sent after ``keepalive_seconds`` without notifications
+    so proxies do not close the idle stream.
+    """
+
+    # Reason: racing the next frame against the disconnect message ends the
+    # stream as soon as the client leaves, without a polling tick.
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(request))
+    next_frame: Optional[asyncio.Future] = None
     try:
         while True:
-            if await request.is_disconnected():
+            if next_frame is None:
+                next_frame = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {next_frame, disconnected},
+                timeout=keepalive_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnected in done:
                 break
-            try:
-                message = await asyncio.wait_for(queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
+            if not done:
+                yield _SSE_KEEPALIVE_FRAME
                 continue
-            yield f"data: {message}\n\n"
+            message = next_frame.result()
+            next_frame = None
+            # Reason: frames that queued up while the client was being written
+            # to are sent together, saving one ASGI send per frame.
+            frames = [message]
+            while len(frames) < _SSE_BATCH_LIMIT:
+                try:
+                    frames.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            yield b"".join(frames) if len(frames) > 1 else message
     finally:
+        if next_frame is not None:
+            next_frame.cancel()
+        disconnected.cancel()
         await notification_hub.remove_subscriber(queue)
 
 
@@ -1,21 +1,27 @@
 import asyncio
 import inspect
-import json
 import logging
 from dataclasses import asdict
 from dataclasses import is_dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from typing import Awaitable
 from typing import Callable
 from typing import Dict
+from typing import Mapping
 from typing import Optional
 from typing import Set
 from typing import Union
 
 import LXMF
+import orjson
 import RNS
 
+from .codec_msgpack import CodecError
+from .codec_msgpack import to_canonical_bytes
+from .codec_msgpack import to_canonical_bytes_with_entries
 from .codec_msgpack import decode_payload_bytes
 from .conversion import decode_payload
 from .conversion import normalise_response
@@ -81,13 +87,21 @@ class _AnnounceHandler:
     aspect_filter = "lxmf"
     receive_path_responses = False
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
-        self._loop = loop
+    def __init__(
+        self,
+        loop_getter: Callable[[], Optional[asyncio.AbstractEventLoop]],
+        queue: asyncio.Queue,
+    ):
+        self._loop_getter = loop_getter
         self._queue = queue
 
     def received_announce(self, destination_hash, announced_identity, app_data, *extra):
         """Enqueue announce metadata on the main event loop thread."""
 
+        loop = self._loop_getter()
+        if loop is None:
+            # Nothing can consume announces before the client joins a loop.
+            return
         announce_packet_hash = extra[0] if extra else None
         event = {
             "destination_hash": destination_hash,
@@ -95,7 +109,137 @@ class _AnnounceHandler:
             "app_data": app_data,
             "announce_packet_hash": announce_packet_hash,
         }
-        self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+
+class _DestinationAnnounceWaiter:
+    """Announce handler that wakes a coroutine when one destination announces."""
+
+    aspect_filter = None
+    receive_path_responses = True
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        destination_hash: bytes,
+        event: asyncio.Event,
+    ):
+        self._loop = loop
+        self._destination_hash = destination_hash
+        self._event = event
+
+    def received_announce(self, destination_hash, announced_identity, app_data, *extra):
+        """Signal the waiting coroutine when the expected destination announces."""
+
+        if destination_hash == self._destination_hash:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+
+@lru_cache(maxsize=128)
+def _normalise_hex_string(dest_hex: str) -> str:
+    """Return the cleaned lowercase form of a destination hash string.
+
+    Gateways resolve the same few server identities on every request, so
+    successful results are memoised; invalid input raises and is not cached.
+
+    Args:
+        dest_hex (str): Raw destination hash input.
+
+    Returns:
+        str: Lowercase hexadecimal string suitable for ``bytes.fromhex``.
+
+    Raises:
+        ValueError: If the input is empty or not an even-length hex string.
+    """
+
+    cleaned = dest_hex.strip()
+    if cleaned.startswith("<") and cleaned.endswith(">"):
+        cleaned = cleaned[1:-1]
+    cleaned = cleaned.replace(" ", "")
+
+    if not cleaned:
+        raise ValueError("Destination identity hash cannot be empty")
+
+    try:
+        bytes.fromhex(cleaned)
+    except ValueError as exc:
+        raise ValueError(
+            "Destination identity hash must be a hexadecimal string"
+        ) from exc
+
+    if len(cleaned) % 2 != 0:
+        raise ValueError(
+            "Destination identity hash must contain an even number of characters"
+        )
+
+    return cleaned.lower()
+
+
+@lru_cache(maxsize=128)
+def _destination_hash_bytes(normalised_hex: str) -> bytes:
+    """Return the binary hash for a normalised destination hex string.
+
+    Keyed alongside :func:`_normalise_hex_string` so repeated commands to the
+    same server reuse the parsed bytes.
+    """
+
+    return bytes.fromhex(normalised_hex)
+
+
+_CACHEABLE_SCALAR_TYPES = (str, int)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _encode_scalar_payload(payload: Union[str, int]) -> bytes:
+    """Return cached MessagePack bytes for a scalar command payload.
+
+    Retrieve and delete commands send the same identifiers repeatedly, so
+    their encodings are memoised instead of rebuilt for every request.
+
+    Args:
+        payload (Union[str, int]): Identifier sent as the command payload.
+
+    Returns:
+        bytes: Canonical MessagePack encoding of ``payload``.
+    """
+
+    return dataclass_to_msgpack(payload)
+
+
+@lru_cache(maxsize=8)
+def _auth_token_entries(auth_token: str) -> Mapping[str, bytes]:
+    """Return the pre-encoded ``auth_token`` entry added to command payloads."""
+
+    return MappingProxyType({"auth_token": to_canonical_bytes(auth_token)})
+
+
+_JSON_FALLBACK_TYPES: Set[type] = set()
+
+
+def _resolve_future(future: asyncio.Future, result: Any) -> None:
+    """Set ``result`` on ``future`` unless it already completed."""
+
+    if not future.done():
+        future.set_result(result)
+
+
+def _fail_future(future: asyncio.Future, exc: BaseException) -> None:
+    """Set ``exc`` on ``future`` unless it already completed."""
+
+    if not future.done():
+        future.set_exception(exc)
+
+
+def _log_json_fallback(payload: Any, exc: CodecError) -> None:
+    """Warn once per payload type that canonical MessagePack was not possible."""
+
+    payload_type = type(payload)
+    if payload_type in _JSON_FALLBACK_TYPES:
+        return
+    _JSON_FALLBACK_TYPES.add(payload_type)
+    logger.warning(
+        "Sending %s payloads as compressed JSON: %s", payload_type.__name__, exc
+    )
 
 
 class LXMFClient:
@@ -135,13 +279,22 @@ class LXMFClient:
         self.source_identity = self.router.register_delivery_identity(
             identity, display_name=display_name, stamp_cost=0
         )
-        self._loop = asyncio.get_event_loop()
+        # Reason: a client built outside a running loop binds to the loop of its
+        # first coroutine call rather than to get_event_loop()'s default loop,
+        # which asyncio.run would never drive.
+        self._bound_loop: Optional[asyncio.AbstractEventLoop] = None
+        try:
+            self._bound_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         self._futures: Dict[str, asyncio.Future] = {}
         self.auth_token = auth_token
         self.timeout = timeout
         self._announce_queue: asyncio.Queue = asyncio.Queue()
         self._announce_task: Optional[asyncio.Task] = None
-        self._announce_handler = _AnnounceHandler(self._loop, self._announce_queue)
+        self._announce_handler = _AnnounceHandler(
+            lambda: self._bound_loop, self._announce_queue
+        )
         RNS.Transport.register_announce_handler(self._announce_handler)
         self._notification_listeners: Set[
             Callable[[str, bytes], Awaitable[None] | None]
@@ -151,6 +304,20 @@ class LXMFClient:
         self._link_events: Dict[bytes, asyncio.Event] = {}
         self._links: Dict[bytes, RNS.Link] = {}
 
+    @property
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        """Return the client's event loop, binding the running loop on first use."""
+
+        loop = getattr(self, "_bound_loop", None)
+        if loop is None:
+            loop = asyncio.get_running_loop()
+            self._bound_loop = loop
+        return loop
+
+    @_loop.setter
+    def _loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._bound_loop = loop
+
     def _get_link_lock(self, dest_hash: bytes) -> asyncio.Lock:
         """Return a lock guarding link creation for ``dest_hash``."""
 
@@ -193,40 +360,78 @@ class LXMFClient:
         deadline = self._loop.time() + timeout
         request_interval = min(1.0, max(0.5, timeout))
         next_request = 0.0
+        announced = asyncio.Event()
+        # Reason: Reticulum remembers the identity before it notifies announce
+        # handlers, so waking on the announce replaces polling the identity
+        # store; the timed wait only paces repeated path requests.
+        waiter = _DestinationAnnounceWaiter(self._loop, dest_hash, announced)
+        RNS.Transport.register_announce_handler(waiter)
+        try:
+            while True:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "Destination identity "
+                        f"{dest_hex} was not announced within {timeout} seconds"
+                    )
 
-        while True:
-            remaining = deadline - self._loop.time()
-            if remaining <= 0:
-                raise TimeoutError(
-                    "Destination identity "
-                    f"{dest_hex} was not announced within {timeout} seconds"
-                )
+                if self._loop.time() >= next_request:
+                    try:
+                        RNS.Transport.request_path(dest_hash)
+                    except Exception:  # pragma: no cover - defensive logging path
+                        logger.debug(
+                            "Failed to request path for destination %s",
+                            dest_hex,
+                            exc_info=True,
+                        )
+                    next_request = self._loop.time() + request_interval
 
-            if self._loop.time() >= next_request:
                 try:
-                    RNS.Transport.request_path(dest_hash)
-                except Exception:  # pragma: no cover - defensive logging path
-                    logger.debug(
-                        "Failed to request path for destination %s",
-                        dest_hex,
-                        exc_info=True,
+                    await asyncio.wait_for(
+                        announced.wait(),
+                        timeout=min(next_request - self._loop.time(), remaining),
                     )
-                next_request = self._loop.time() + request_interval
-
-            await asyncio.sleep(min(0.2, remaining))
-            identity = RNS.Identity.recall(dest_hash)
-            if identity is not None:
-                return identity
+                except asyncio.TimeoutError:
+                    pass
+                announced.clear()
+                identity = RNS.Identity.recall(dest_hash)
+                if identity is not None:
+                    return identity
+        finally:
+            RNS.Transport.deregister_announce_handler(waiter)
 
     async def _ensure_link(
         self, dest_hex: str, dest_hash: bytes, timeout: float
     ) -> RNS.Link:
         """Return an established link to the remote destination."""
 
+        link = self._links.get(dest_hash)
+        event = self._link_events.get(dest_hash)
+        if (
+            link is not None
+            and event is not None
+            and event.is_set()
+            and link.status == RNS.Link.ACTIVE
+        ):
+            # Reason: warm links are reused without queueing on the creation
+            # lock, so concurrent commands do not serialise behind each other.
+            return link
+
         link_lock = self._get_link_lock(dest_hash)
         async with link_lock:
             link = self._links.get(dest_hash)
             event = self._link_events.get(dest_hash)
+            if (
+                link is not None
+                and event is not None
+                and event.is_set()
+                and link.status != RNS.Link.ACTIVE
+            ):
+                # Reason: _on_closed forgets links via the event loop, so a
+                # link closed by RNS may still be cached; replace it here.
+                self._links.pop(dest_hash, None)
+                self._link_events.pop(dest_hash, None)
+                link = event = None
             if link is None or event is None:
                 dest_identity = await self._resolve_destination_identity(
                     dest_hex, dest_hash, timeout
@@ -235,13 +440,16 @@ class LXMFClient:
                 event = asyncio.Event()
 
                 def _on_established(new_link: RNS.Link) -> None:
-                    event.set()
+                    self._loop.call_soon_threadsafe(event.set)
 
-                def _on_closed(closed_link: RNS.Link) -> None:
+                def _forget_link() -> None:
                     self._links.pop(dest_hash, None)
                     self._link_events.pop(dest_hash, None)
                     self._link_locks.pop(dest_hash, None)
 
+                def _on_closed(closed_link: RNS.Link) -> None:
+                    self._loop.call_soon_threadsafe(_forget_link)
+
                 link = RNS.Link(
                     destination,
                     established_callback=_on_established,
@@ -281,7 +489,7 @@ class LXMFClient:
         """
 
         normalised_hex = self._normalise_destination_hex(dest_hex)
-        dest_hash = bytes.fromhex(normalised_hex)
+        dest_hash = _destination_hash_bytes(normalised_hex)
         timeout_value = self.timeout if timeout is None else float(timeout)
         return await self._ensure_link(normalised_hex, dest_hash, timeout_value)
 
@@ -313,25 +521,34 @@ class LXMFClient:
         return str(title)
 
     def _callback(self, message: LXMF.LXMessage):
+        loop = getattr(self, "_bound_loop", None)
+        if loop is None:
+            # No request or listener can be waiting before the loop is bound.
+            return
+        if not self._futures and not self._notification_listeners:
+            # Reason: commands are answered over links, so most deliveries
+            # have no consumer; skip decoding the title for those.
+            return
         title = self._normalise_message_title(message.title)
         if title is None:
             RNS.log(f"Invalid response title received: {message.title!r}")
             return
+        # Reason: LXMF delivers on its own thread, so futures and listener
+        # tasks are only touched from the event loop.
+        loop.call_soon_threadsafe(self._route_message, title, message.content)
+
+    def _route_message(self, title: str, content: Optional[bytes]) -> None:
+        """Resolve a waiting future or notify listeners on the event loop."""
+
         future = self._futures.pop(title, None)
         if future is not None:
-            if not future.done():
-                future.set_result(message.content)
+            _resolve_future(future, content)
             return
 
         if not self._notification_listeners:
             return
 
-        def _dispatch() -> None:
-            asyncio.create_task(
-                self._dispatch_notification(title, message.content or b"")
-            )
-
-        self._loop.call_soon_threadsafe(_dispatch)
+        asyncio.create_task(self._dispatch_notification(title, content or b""))
 
     @staticmethod
     def _normalise_destination_hex(dest_hex: str) -> str:
@@ -350,28 +567,7 @@ class LXMFClient:
 
         if not isinstance(dest_hex, str):
             raise TypeError("Destination identity hash must be provided as a string")
-
-        cleaned = dest_hex.strip()
-        if cleaned.startswith("<") and cleaned.endswith(">"):
-            cleaned = cleaned[1:-1]
-        cleaned = cleaned.replace(" ", "")
-
-        if not cleaned:
-            raise ValueError("Destination identity hash cannot be empty")
-
-        try:
-            bytes.fromhex(cleaned)
-        except ValueError as exc:
-            raise ValueError(
-                "Destination identity hash must be a hexadecimal string"
-            ) from exc
-
-        if len(cleaned) % 2 != 0:
-            raise ValueError(
-                "Destination identity hash must contain an even number of characters"
-            )
-
-        return cleaned.lower()
+        return _normalise_hex_string(dest_hex)
 
     @staticmethod
     def _decode_shared_instance_rpc_key(value: str) -> bytes:
@@ -429,7 +625,7 @@ class LXMFClient:
             TimeoutError: If a transport path cannot be established before ``path_timeout`` elapses.
         """
         dest_hex = self._normalise_destination_hex(dest_hex)
-        dest_hash = bytes.fromhex(dest_hex)
+        dest_hash = _destination_hash_bytes(dest_hex)
         if path_timeout is None:
             path_timeout = self.timeout
 
@@ -448,15 +644,44 @@ class LXMFClient:
             content_bytes = b""
         elif isinstance(payload_obj, bytes):
             content_bytes = payload_obj
+        elif type(payload_obj) in _CACHEABLE_SCALAR_TYPES and not self.auth_token:
+            try:
+                content_bytes = _encode_scalar_payload(payload_obj)
+            except CodecError as exc:
+                # Reason: integers outside the MessagePack range still have
+                # a JSON encoding.
+                _log_json_fallback(payload_obj, exc)
+                json_bytes = dataclass_to_json_bytes(payload_obj)
+                content_bytes = compress_json(json_bytes)
+        elif is_dataclass(payload_obj) and not self.auth_token:
+            # Reason: dataclasses are packed field by field, so the
+            # intermediate dictionary is only built for the JSON fallback.
+            try:
+                content_bytes = dataclass_to_msgpack(payload_obj)
+            except CodecError as exc:
+                _log_json_fallback(payload_obj, exc)
+                json_bytes = dataclass_to_json_bytes(payload_obj)
+                content_bytes = compress_json(json_bytes)
         else:
-            data_dict = (
-                asdict(payload_obj) if is_dataclass(payload_obj) else payload_obj
-            )
-            if self.auth_token:
-                data_dict["auth_token"] = self.auth_token
             try:
-                content_bytes = dataclass_to_msgpack(data_dict)
-            except Exception:
+                if self.auth_token:
+                    # Reason: the token is merged into the packed map from
+                    # cached bytes, so neither the payload nor a copy of it
+                    # is turned into a new dict.
+                    content_bytes = to_canonical_bytes_with_entries(
+                        payload_obj, _auth_token_entries(self.auth_token)
+                    )
+                else:
+                    content_bytes = dataclass_to_msgpack(payload_obj)
+            except CodecError as exc:
+                # Reason: only values the canonical codec rejects, such as
+                # floats, fall back to JSON; any other error propagates.
+                _log_json_fallback(payload_obj, exc)
+                data_dict = (
+                    asdict(payload_obj) if is_dataclass(payload_obj) else payload_obj
+                )
+                if self.auth_token:
+                    data_dict = {**data_dict, "auth_token": self.auth_token}
                 json_bytes = dataclass_to_json_bytes(data_dict)
                 content_bytes = compress_json(json_bytes)
 
@@ -469,8 +694,10 @@ class LXMFClient:
                 payload = getattr(receipt, "response", None)
                 if payload is None:
                     payload = receipt
-                if not response_future.done():
-                    response_future.set_result(payload)
+                # Reason: RNS runs receipt callbacks on its transport thread.
+                self._loop.call_soon_threadsafe(
+                    _resolve_future, response_future, payload
+                )
 
             def _failed_callback(receipt: Any) -> None:
                 nonlocal failure_message
@@ -482,8 +709,9 @@ class LXMFClient:
                     dest_hex,
                     description,
                 )
-                if not response_future.done():
-                    response_future.set_exception(TimeoutError(failure_message))
+                self._loop.call_soon_threadsafe(
+                    _fail_future, response_future, TimeoutError(failure_message)
+                )
 
             link.request(
                 request_path,
@@ -893,14 +1121,14 @@ class LXMFClient:
             return {}
 
         try:
-            contents = target_path.read_text(encoding="utf-8")
+            contents = target_path.read_bytes()
         except OSError as exc:
             handler(f"Unable to read configuration from {target_path}: {exc}")
             return {}
 
         try:
-            data = json.loads(contents)
-        except json.JSONDecodeError as exc:
+            data = orjson.loads(contents)
+        except orjson.JSONDecodeError as exc:
             handler(f"Invalid JSON in {target_path}: {exc}")
             return {}
 
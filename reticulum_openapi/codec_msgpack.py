@@ -22,7 +22,10 @@ MessagePack Canonicalization Rules (Critical for Signatures)
 
 import json
 import zlib
-from typing import Any, TYPE_CHECKING, Union
+from dataclasses import fields
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, TYPE_CHECKING, Tuple, Union
 
 # Optional dependencies
 try:
@@ -136,8 +139,15 @@ def _pack_array(arr: list) -> bytes:
     return prefix + b"".join(_pack(x) for x in arr)
 
 
+def _map_header(n: int) -> bytes:
+    if n <= 15:
+        return bytes([0x80 | n])
+    if n <= 0xFFFF:
+        return b"\xde" + n.to_bytes(2, "big")
+    return b"\xdf" + n.to_bytes(4, "big")
+
+
 def _pack_map(d: dict) -> bytes:
-    n = len(d)
     # Keys must be strings; order by UTF-8 bytes
     items = []
     for k, v in d.items():
@@ -145,19 +155,31 @@ def _pack_map(d: dict) -> bytes:
             raise CodecError("Canonical maps require string keys")
         items.append((k.encode("utf-8"), k, v))
     items.sort(key=lambda t: t[0])
-    if n <= 15:
-        prefix = bytes([0x80 | n])
-    elif n <= 0xFFFF:
-        prefix = b"\xde" + n.to_bytes(2, "big")
-    else:
-        prefix = b"\xdf" + n.to_bytes(4, "big")
-    out = [prefix]
+    out = [_map_header(len(d))]
     for key_bytes, key_str, val in items:
         out.append(_pack_str(key_str))
         out.append(_pack(val))
     return b"".join(out)
 
 
+@lru_cache(maxsize=None)
+def _dataclass_keys(cls: type) -> Tuple[Tuple[bytes, str], ...]:
+    """Return packed keys and attribute names for ``cls`` in canonical order."""
+    names = sorted((f.name for f in fields(cls)), key=lambda name: name.encode("utf-8"))
+    return tuple((_pack_str(name), name) for name in names)
+
+
+def _pack_dataclass(o: Any) -> bytes:
+    # Reason: packing attributes directly avoids the deep copy performed by
+    # dataclasses.asdict and produces the same bytes as packing that dict.
+    keys = _dataclass_keys(type(o))
+    out = [_map_header(len(keys))]
+    for packed_key, name in keys:
+        out.append(packed_key)
+        out.append(_pack(getattr(o, name)))
+    return b"".join(out)
+
+
 def _pack(o: Any) -> bytes:
     if o is None:
         return _pack_nil()
@@ -175,6 +197,8 @@ def _pack(o: Any) -> bytes:
         return _pack_array(list(o))
     if isinstance(o, dict):
         return _pack_map(o)
+    if is_dataclass(o) and not isinstance(o, type):
+        return _pack_dataclass(o)
     # Float or others are not allowed for canonical/signed bytes
     raise CodecError(f"Type not allowed in canonical MessagePack: {type(o).__name__}")
 
@@ -191,6 +215,35 @@ def to_canonical_bytes(obj: Any) -> bytes:
     return _pack(obj)
 
 
+def to_canonical_bytes_with_entries(obj: Any, entries: Mapping[str, bytes]) -> bytes:
+    """
+    Encode a dataclass or string-keyed dict merged with pre-encoded entries.
+
+    ``entries`` maps keys to values that are already canonical MessagePack
+    bytes and override fields of the same name. The result equals
+    ``to_canonical_bytes`` of the merged mapping without building it.
+    """
+    merged: Dict[bytes, Tuple[bytes, bytes]] = {}
+    if is_dataclass(obj) and not isinstance(obj, type):
+        for packed_key, name in _dataclass_keys(type(obj)):
+            merged[name.encode("utf-8")] = (packed_key, _pack(getattr(obj, name)))
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            if not isinstance(k, str):
+                raise CodecError("Canonical maps require string keys")
+            merged[k.encode("utf-8")] = (_pack_str(k), _pack(v))
+    else:
+        raise CodecError(
+            f"Entries can only be merged into maps, not {type(obj).__name__}"
+        )
+    for k, packed_value in entries.items():
+        merged[k.encode("utf-8")] = (_pack_str(k), packed_value)
+    out = [_map_header(len(merged))]
+    for key_bytes in sorted(merged):
+        out.extend(merged[key_bytes])
+    return b"".join(out)
+
+
 def from_bytes(b: bytes) -> Any:
     """
     Decode MessagePack bytes to Python object using msgpack if available.
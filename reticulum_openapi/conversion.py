@@ -6,10 +6,14 @@ import inspect
 import json
 import sys
 import zlib
+from collections import ChainMap
 from dataclasses import fields
 from dataclasses import is_dataclass
 from enum import Enum
+from functools import lru_cache
+from functools import partial
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Mapping
@@ -88,6 +92,73 @@ def _default_for_type(expected_type: Any) -> Any:
     return _SENTINEL
 
 
+def _convert_str(value: Any) -> str:
+    """Return ``value`` as a string, decoding UTF-8 bytes when required."""
+
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        try:
+            return bytes(value).decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise ValueError("Unable to decode bytes to string") from exc
+    raise TypeError(f"Expected string for type {str}")
+
+
+def _convert_int(value: Any) -> int:
+    """Return ``value`` as an integer, rejecting booleans and lossy floats."""
+
+    if isinstance(value, bool):
+        raise TypeError("Boolean value is not a valid integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip(), 10)
+        except ValueError as exc:
+            raise ValueError(f"Unable to convert {value!r} to int") from exc
+    raise TypeError(f"Expected integer for type {int}")
+
+
+def _convert_float(value: Any) -> float:
+    """Return ``value`` as a float, parsing numeric strings."""
+
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError as exc:
+            raise ValueError(f"Unable to convert {value!r} to float") from exc
+    raise TypeError(f"Expected float for type {float}")
+
+
+def _convert_bool(value: Any) -> bool:
+    """Return ``value`` as a boolean, accepting common textual flags."""
+
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in {"true", "1", "yes", "on"}:
+            return True
+        if lowered in {"false", "0", "no", "off"}:
+            return False
+    raise TypeError(f"Expected boolean for type {bool}")
+
+
+# Reason: primitive leaves dominate conversion work, so resolve their
+# converter with a single dictionary lookup instead of an ``if`` ladder.
+_PRIMITIVE_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {
+    str: _convert_str,
+    int: _convert_int,
+    float: _convert_float,
+    bool: _convert_bool,
+}
+
+
 def convert_value(expected_type: Any, value: Any) -> Any:
     """Recursively convert ``value`` into the supplied ``expected_type``.
 
@@ -105,6 +176,9 @@ def convert_value(expected_type: Any, value: Any) -> Any:
             literal choices or failed numeric parsing.
     """
 
+    if type(value) is expected_type:
+        return value
+
     if expected_type in {Any, object}:
         return value
 
@@ -190,6 +264,10 @@ def convert_value(expected_type: Any, value: Any) -> Any:
                 return value
             return convert_value(annotated_args[0], value)
 
+    primitive_converter = _PRIMITIVE_CONVERTERS.get(expected_type)
+    if primitive_converter is not None:
+        return primitive_converter(value)
+
     if inspect.isclass(expected_type):
         if issubclass(expected_type, Enum):
             if isinstance(value, expected_type):
@@ -200,47 +278,6 @@ def convert_value(expected_type: Any, value: Any) -> Any:
                 raise ValueError(
                     f"Value {value!r} is not valid for enum {expected_type.__name__}"
                 ) from exc
-        if expected_type is str:
-            if isinstance(value, str):
-                return value
-            if isinstance(value, (bytes, bytearray, memoryview)):
-                try:
-                    return bytes(value).decode("utf-8")
-                except UnicodeDecodeError as exc:
-                    raise ValueError("Unable to decode bytes to string") from exc
-            raise TypeError(f"Expected string for type {expected_type}")
-        if expected_type is int:
-            if isinstance(value, bool):
-                raise TypeError("Boolean value is not a valid integer")
-            if isinstance(value, int):
-                return value
-            if isinstance(value, float) and value.is_integer():
-                return int(value)
-            if isinstance(value, str):
-                try:
-                    return int(value.strip(), 10)
-                except ValueError as exc:
-                    raise ValueError(f"Unable to convert {value!r} to int") from exc
-            raise TypeError(f"Expected integer for type {expected_type}")
-        if expected_type is float:
-            if isinstance(value, (int, float)):
-                return float(value)
-            if isinstance(value, str):
-                try:
-                    return float(value.strip())
-                except ValueError as exc:
-                    raise ValueError(f"Unable to convert {value!r} to float") from exc
-            raise TypeError(f"Expected float for type {expected_type}")
-        if expected_type is bool:
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                lowered = value.strip().lower()
-                if lowered in {"true", "1", "yes", "on"}:
-                    return True
-                if lowered in {"false", "0", "no", "off"}:
-                    return False
-            raise TypeError(f"Expected boolean for type {expected_type}")
         if is_dataclass(expected_type):
             if isinstance(value, expected_type):
                 return value
@@ -253,12 +290,19 @@ def convert_value(expected_type: Any, value: Any) -> Any:
     return value
 
 
-def build_dataclass(cls: Type[T], data: Mapping[str, Any]) -> T:
+def build_dataclass(
+    cls: Type[T],
+    data: Mapping[str, Any],
+    *,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> T:
     """Construct ``cls`` from ``data`` applying type conversions.
 
     Args:
         cls (Type[T]): Dataclass type to instantiate.
         data (Mapping[str, Any]): Mapping containing payload values.
+        overrides (Optional[Mapping[str, Any]]): Values that take precedence
+            over ``data``, such as path parameters. ``data`` is not copied.
 
     Returns:
         T: Instance of ``cls`` populated with converted values.
@@ -270,17 +314,84 @@ def build_dataclass(cls: Type[T], data: Mapping[str, Any]) -> T:
     if not isinstance(data, Mapping):
         raise TypeError("Request payload must be a mapping")
 
+    if overrides:
+        data = ChainMap(overrides, data)
+    return _dataclass_builder(cls)(data)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_field_types(cls: Type[Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Return cached ``(field name, resolved annotation)`` pairs for ``cls``.
+
+    Args:
+        cls (Type[Any]): Dataclass type whose fields should be resolved.
+
+    Returns:
+        Tuple[Tuple[str, Any], ...]: Field names paired with their resolved
+        type annotations.
+    """
+
     module = sys.modules.get(cls.__module__)
     globalns = vars(module) if module is not None else {}
     type_hints = get_type_hints(cls, globalns=globalns)
+    return tuple(
+        (field.name, type_hints.get(field.name, field.type)) for field in fields(cls)
+    )
+
 
-    kwargs: Dict[str, Any] = {}
-    for field in fields(cls):
-        if field.name not in data:
-            continue
-        expected_type = type_hints.get(field.name, field.type)
-        kwargs[field.name] = convert_value(expected_type, data[field.name])
-    return cls(**kwargs)
+def _passthrough_check(expected_type: Any) -> Optional[str]:
+    """Return a source expression matching values that need no conversion.
+
+    Args:
+        expected_type (Any): Resolved field annotation.
+
+    Returns:
+        Optional[str]: Expression over ``value`` or ``None`` when every value
+        must go through :func:`convert_value`.
+    """
+
+    if expected_type in _PRIMITIVE_CONVERTERS:
+        return f"type(value) is {expected_type.__name__}"
+    if get_origin(expected_type) is Union:
+        args = [arg for arg in get_args(expected_type) if arg is not type(None)]
+        if len(args) == 1 and args[0] in _PRIMITIVE_CONVERTERS:
+            return f"value is None or type(value) is {args[0].__name__}"
+    return None
+
+
+@lru_cache(maxsize=None)
+def _dataclass_builder(cls: Type[T]) -> Callable[[Mapping[str, Any]], T]:
+    """Compile and cache a straight-line constructor for dataclass ``cls``.
+
+    Args:
+        cls (Type[T]): Dataclass type to build instances of.
+
+    Returns:
+        Callable[[Mapping[str, Any]], T]: Function converting a mapping into an
+        instance of ``cls``.
+    """
+
+    # Reason: walking field metadata for every payload costs far more than the
+    # conversions themselves, so emit one specialised function per class with
+    # primitive fast paths inlined and everything else bound to convert_value.
+    namespace: Dict[str, Any] = {"cls": cls}
+    lines = ["def build(data):", "    kwargs = {}"]
+    for index, (name, expected_type) in enumerate(_dataclass_field_types(cls)):
+        converter = f"convert_{index}"
+        namespace[converter] = partial(convert_value, expected_type)
+        lines.append(f"    if {name!r} in data:")
+        lines.append(f"        value = data[{name!r}]")
+        check = _passthrough_check(expected_type)
+        if check is None:
+            lines.append(f"        kwargs[{name!r}] = {converter}(value)")
+        else:
+            lines.append(
+                f"        kwargs[{name!r}] = value if {check} else {converter}(value)"
+            )
+    lines.append("    return cls(**kwargs)")
+    source = "\n".join(lines)
+    exec(compile(source, f"<dataclass builder {cls.__qualname__}>", "exec"), namespace)
+    return namespace["build"]
 
 
 def _attempt_json_decode(payload: bytes) -> Any:
@@ -374,14 +485,14 @@ def prepare_dataclass_payload(
             return dict(overrides)
         return None
 
-    combined: Dict[str, Any] = {}
-    if payload is not None:
-        combined.update(payload)
-    if overrides is not None:
-        combined.update(overrides)
-
+    base = payload if payload is not None else {}
     if is_dataclass(expected_type):
-        return build_dataclass(expected_type, combined)
+        return build_dataclass(expected_type, base, overrides=overrides)
+
+    combined: Mapping[str, Any] = base
+    if overrides:
+        combined = dict(base)
+        combined.update(overrides)
     return convert_value(expected_type, combined)
 
 
@@ -7,6 +7,9 @@ from .dependencies import LXMFClientManager
 from .interfaces import gather_interface_status
 from .link import LinkManager
 from .link import LinkStatus
+from .responses import ORJSONResponse
+from .routing import ORJSONRequest
+from .routing import ORJSONRoute
 from .settings import LXMFClientSettings
 from .settings import create_settings_loader
 from .settings import load_lxmf_client_settings
@@ -17,6 +20,9 @@ __all__ = [
     "LXMFClientManager",
     "LinkManager",
     "LinkStatus",
+    "ORJSONRequest",
+    "ORJSONResponse",
+    "ORJSONRoute",
     "create_command_context_dependency",
     "create_settings_loader",
     "gather_interface_status",
@@ -2,37 +2,69 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
+from typing import Annotated
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from fastapi import Header
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import status
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 from reticulum_openapi.client import LXMFClient as BaseLXMFClient
-from reticulum_openapi.conversion import normalise_response
+from reticulum_openapi.codec_msgpack import CodecError
+from reticulum_openapi.codec_msgpack import to_canonical_bytes
 from reticulum_openapi.conversion import prepare_dataclass_payload
 
 from .dependencies import LXMFClientManager
+from .responses import ORJSONResponse
 
 
 logger = logging.getLogger(__name__)
 
+RequestBody = Union[BaseModel, Mapping[str, Any]]
+
+# Reason: keyed by (server identity, command, canonical payload bytes) so
+# concurrent identical reads share a single LXMF round-trip.
+_INFLIGHT_COMMANDS: Dict[Tuple[str, str, bytes], "asyncio.Future[Any]"] = {}
+
+ResponseCacheKey = Tuple[str, str, bytes]
+ResponseCache = Dict[ResponseCacheKey, Tuple[float, Any]]
+
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Reason: bumped per server identity by every write, so a read that was in
+# flight across a write can tell its result may be stale.
+_RESPONSE_GENERATIONS: Dict[str, int] = {}
+
 
 @dataclass(frozen=True)
 class CommandSpec:
-    """Describe an LXMF command handled by a FastAPI endpoint."""
+    """Describe an LXMF command handled by a FastAPI endpoint.
+
+    Set ``idempotent`` for read-only commands so concurrent identical requests
+    are coalesced into a single LXMF round-trip. ``cache_ttl_seconds`` also
+    keeps an idempotent command's response for that many seconds so repeated
+    polls are answered without touching the mesh.
+    """
 
     command: str
     request_type: Optional[Any] = None
     response_type: Optional[Any] = None
     path_field: Optional[str] = None
+    idempotent: bool = False
+    cache_ttl_seconds: Optional[float] = None
 
 
 class LXMFCommandContext:
@@ -43,32 +75,68 @@ class LXMFCommandContext:
         manager: LXMFClientManager,
         server_identity: str,
         command_specs: Mapping[str, CommandSpec],
+        *,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._manager = manager
         self._server_identity = server_identity
         self._command_specs = command_specs
+        self._response_cache = response_cache
 
     async def execute(
         self,
         key: str,
         *,
-        body: Optional[Mapping[str, Any]] = None,
+        body: Optional[RequestBody] = None,
         payload: Optional[Any] = None,
         path_params: Optional[Mapping[str, Any]] = None,
     ) -> JSONResponse:
         """Send the LXMF command described by ``key`` and normalise the response."""
 
-        if key not in self._command_specs:
+        spec = self._command_specs.get(key)
+        if spec is None:
             raise KeyError(f"Unknown LXMF command key: {key}")
+        return await self.execute_spec(
+            spec, body=body, payload=payload, path_params=path_params
+        )
+
+    async def execute_spec(
+        self,
+        spec: CommandSpec,
+        *,
+        body: Optional[RequestBody] = None,
+        payload: Optional[Any] = None,
+        path_params: Optional[Mapping[str, Any]] = None,
+    ) -> JSONResponse:
+        """Send the LXMF command described by ``spec`` directly.
+
+        Routes that resolve their :class:`CommandSpec` when they are built can
+        call this to skip the per-request lookup by key.
+
+        Args:
+            spec (CommandSpec): Command to send.
+            body (Optional[RequestBody]): Request body to convert.
+            payload (Optional[Any]): Pre-built payload sent as-is.
+            path_params (Optional[Mapping[str, Any]]): Path values merged into
+                dataclass payloads.
+
+        Returns:
+            JSONResponse: The decoded command response.
+        """
 
-        spec = self._command_specs[key]
         request_payload = self._prepare_payload(spec, body, payload, path_params)
-        return await self._send_command(spec.command, request_payload, spec.response_type)
+        return await self._send_command(
+            spec.command,
+            request_payload,
+            spec.response_type,
+            coalesce=spec.idempotent,
+            cache_ttl_seconds=spec.cache_ttl_seconds,
+        )
 
     def _prepare_payload(
         self,
         spec: CommandSpec,
-        body: Optional[Mapping[str, Any]],
+        body: Optional[RequestBody],
         payload: Optional[Any],
         path_params: Optional[Mapping[str, Any]],
     ) -> Optional[Any]:
@@ -77,27 +145,114 @@ class LXMFCommandContext:
         if payload is not None:
             return payload
 
+        if isinstance(body, BaseModel):
+            # Reason: FastAPI already validated the body, so only the fields the
+            # client supplied are forwarded and dataclass defaults still apply.
+            body = body.model_dump(exclude_unset=True)
+
         if spec.request_type is not None:
-            overrides = dict(path_params or {})
-            raw_payload = dict(body or {})
-            return prepare_dataclass_payload(spec.request_type, raw_payload, overrides=overrides)
+            return prepare_dataclass_payload(
+                spec.request_type, body or {}, overrides=path_params
+            )
 
         if spec.path_field and path_params and spec.path_field in path_params:
             return path_params[spec.path_field]
 
-        if body is None:
-            return None
-
-        return dict(body)
+        return body
 
     async def _send_command(
         self,
         command: str,
         request_payload: Optional[Any],
         response_type: Optional[Any],
+        *,
+        coalesce: bool = False,
+        cache_ttl_seconds: Optional[float] = None,
     ) -> JSONResponse:
         """Send a command through LXMF and return the decoded response."""
 
+        if coalesce:
+            content = await self._request_coalesced(
+                command, request_payload, response_type, cache_ttl_seconds
+            )
+        else:
+            # Reason: a write may change what reads return, so reads issued
+            # before or during it must neither be cached nor joined after it.
+            self._invalidate_cached_responses()
+            try:
+                content = await self._request_content(
+                    command, request_payload, response_type
+                )
+            finally:
+                self._invalidate_cached_responses()
+        return ORJSONResponse(content=content)
+
+    async def _request_coalesced(
+        self,
+        command: str,
+        request_payload: Optional[Any],
+        response_type: Optional[Any],
+        cache_ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """Share one in-flight LXMF request between identical callers."""
+
+        try:
+            payload_key = to_canonical_bytes(request_payload)
+        except CodecError:
+            return await self._request_content(command, request_payload, response_type)
+
+        key = (self._server_identity, command, payload_key)
+        cache = self._response_cache if cache_ttl_seconds else None
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        task = _INFLIGHT_COMMANDS.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_content(command, request_payload, response_type)
+            )
+            _INFLIGHT_COMMANDS[key] = task
+            task.add_done_callback(lambda done: _forget_inflight(key, done))
+            if cache is not None:
+                generation = _RESPONSE_GENERATIONS.get(self._server_identity, 0)
+                task.add_done_callback(
+                    lambda done: _store_cached_response(
+                        cache, key, done, cache_ttl_seconds, generation
+                    )
+                )
+        # Reason: shield the shared request so one client disconnecting does
+        # not cancel the round-trip other callers are waiting on.
+        return await asyncio.shield(task)
+
+    def _invalidate_cached_responses(self) -> None:
+        """Drop cached and in-flight responses for the bound server identity.
+
+        The server's generation is bumped as well, so reads already in flight
+        finish for their callers but are not stored in the cache.
+        """
+
+        server_identity = self._server_identity
+        _RESPONSE_GENERATIONS[server_identity] = (
+            _RESPONSE_GENERATIONS.get(server_identity, 0) + 1
+        )
+        for key in [key for key in _INFLIGHT_COMMANDS if key[0] == server_identity]:
+            del _INFLIGHT_COMMANDS[key]
+        cache = self._response_cache
+        if not cache:
+            return
+        for key in [key for key in cache if key[0] == server_identity]:
+            del cache[key]
+
+    async def _request_content(
+        self,
+        command: str,
+        request_payload: Optional[Any],
+        response_type: Optional[Any],
+    ) -> Any:
+        """Send a command through LXMF and return the decoded response."""
+
         client = self._manager.get_client()
         try:
             response = await client.send_command(
@@ -129,11 +284,44 @@ class LXMFCommandContext:
                 detail=str(exc),
             ) from exc
 
-        if response is None:
-            return JSONResponse(content=None)
+        # Reason: ORJSONResponse encodes dataclasses and enums natively, so the
+        # decoded response is rendered without a normalise_response pass.
+        return response
+
+
+def _forget_inflight(key: ResponseCacheKey, task: "asyncio.Future[Any]") -> None:
+    """Remove ``task`` from the in-flight table unless it was replaced."""
+
+    if _INFLIGHT_COMMANDS.get(key) is task:
+        del _INFLIGHT_COMMANDS[key]
+
 
-        normalised = normalise_response(response)
-        return JSONResponse(content=normalised)
+def _store_cached_response(
+    cache: ResponseCache,
+    key: ResponseCacheKey,
+    task: "asyncio.Future[Any]",
+    ttl_seconds: float,
+    generation: int,
+) -> None:
+    """Cache the result of a successful shared request for ``ttl_seconds``.
+
+    Results are dropped when a write for the same server identity happened
+    after the request started, as recorded by ``generation``.
+    """
+
+    if task.cancelled() or task.exception() is not None:
+        return
+    if _RESPONSE_GENERATIONS.get(key[0], 0) != generation:
+        return
+    now = time.monotonic()
+    if len(cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+        # Reason: keys include request payloads, so bound the cache by dropping
+        # expired entries first and the oldest insertions after that.
+        for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+            del cache[stale]
+        while len(cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+    cache[key] = (now + ttl_seconds, task.result())
 
 
 def _resolve_server_identity(
@@ -166,18 +354,31 @@ def create_command_context_dependency(
     manager: LXMFClientManager,
     command_specs: Mapping[str, CommandSpec],
 ) -> Callable[..., LXMFCommandContext]:
-    """Return a dependency that resolves server identity and command context."""
+    """Return a dependency that resolves server identity and command context.
+
+    Responses of commands whose spec sets ``cache_ttl_seconds`` are cached per
+    dependency, so each application keeps its own short-lived cache.
+    """
+
+    response_cache: ResponseCache = {}
 
     async def _dependency(
-        server_identity_query: Optional[str] = Query(None, alias="server_identity"),
-        server_identity_header: Optional[str] = Header(
-            None, alias="X-Server-Identity"
-        ),
+        server_identity_query: Annotated[
+            Optional[str], Query(alias="server_identity")
+        ] = None,
+        server_identity_header: Annotated[
+            Optional[str], Header(alias="X-Server-Identity")
+        ] = None,
     ) -> LXMFCommandContext:
         server_identity = _resolve_server_identity(
             manager, server_identity_query, server_identity_header
         )
-        return LXMFCommandContext(manager, server_identity, command_specs)
+        return LXMFCommandContext(
+            manager,
+            server_identity,
+            command_specs,
+            response_cache=response_cache,
+        )
 
     return _dependency
 
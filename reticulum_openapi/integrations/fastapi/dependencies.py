@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from contextlib import suppress
+from threading import Lock
+from typing import AsyncContextManager
+from typing import AsyncIterator
 from typing import Awaitable
 from typing import Callable
 from typing import Optional
@@ -34,6 +38,7 @@ class LXMFClientManager:
         self._client_factory = client_factory or self._default_factory
         self._announce_on_startup = announce_on_startup
         self._client: Optional[LXMFClient] = None
+        self._client_lock = Lock()
         self._notification_unsubscriber: Optional[Callable[[], Awaitable[None]]] = None
 
     @staticmethod
@@ -57,13 +62,31 @@ class LXMFClientManager:
     def get_client(self) -> LXMFClient:
         """Return the shared LXMF client, creating it if required."""
 
-        if self._client is None:
-            settings = self.get_settings()
-            client = self._client_factory(settings)
-            if self._announce_on_startup and hasattr(client, "announce"):
-                client.announce()
-            self._client = client
-        return self._client
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            # Reason: re-check under the lock so concurrent first callers (the
+            # lifespan hook and threadpool dependencies) never build and
+            # announce two clients.
+            if self._client is None:
+                settings = self.get_settings()
+                client = self._client_factory(settings)
+                if self._announce_on_startup and hasattr(client, "announce"):
+                    client.announce()
+                self._client = client
+            return self._client
+
+    def set_client(self, client: Optional[LXMFClient]) -> None:
+        """Replace the shared client, e.g. with a test double.
+
+        Args:
+            client (Optional[LXMFClient]): Client to hand out from
+                :meth:`get_client`, or ``None`` to build a fresh one on the
+                next call.
+        """
+
+        self._client = client
 
     def get_server_identity(self) -> Optional[str]:
         """Return the configured server identity hash when available."""
@@ -96,6 +119,60 @@ class LXMFClientManager:
         with suppress(Exception):  # pragma: no cover - defensive cleanup
             client.stop_listening_for_announces()
 
+    async def startup(
+        self,
+        attach_notifications: Optional[
+            Callable[[LXMFClient], Awaitable[Callable[[], Awaitable[None]]]]
+        ] = None,
+    ) -> LXMFClient:
+        """Create the shared client and optionally attach notifications.
+
+        Args:
+            attach_notifications (Optional[Callable]): Coroutine that hooks
+                notification forwarding onto the client and returns an
+                unsubscribe callable.
+
+        Returns:
+            LXMFClient: The shared client instance.
+        """
+
+        client = self.get_client()
+        if attach_notifications is not None:
+            unsubscribe = await attach_notifications(client)
+            self.set_notification_unsubscriber(unsubscribe)
+        return client
+
+    def lifespan(
+        self,
+        *,
+        attach_notifications: Optional[
+            Callable[[LXMFClient], Awaitable[Callable[[], Awaitable[None]]]]
+        ] = None,
+    ) -> Callable[[FastAPI], AsyncContextManager[None]]:
+        """Return a FastAPI ``lifespan`` handler managing the client.
+
+        The client is created once before the app serves requests, exposed as
+        ``app.state.lxmf_client``, and shut down when the app stops.
+
+        Args:
+            attach_notifications (Optional[Callable]): Passed to
+                :meth:`startup`.
+
+        Returns:
+            Callable[[FastAPI], AsyncContextManager[None]]: Value for the
+            ``lifespan`` argument of :class:`fastapi.FastAPI`.
+        """
+
+        @asynccontextmanager
+        async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+            app.state.lxmf_client = await self.startup(attach_notifications)
+            try:
+                yield
+            finally:
+                await self.shutdown()
+
+        return _lifespan
+
     def register_events(
         self,
         app: FastAPI,
@@ -104,14 +181,15 @@ class LXMFClientManager:
             Callable[[LXMFClient], Awaitable[Callable[[], Awaitable[None]]]]
         ] = None,
     ) -> None:
-        """Register FastAPI events for managing the LXMF client lifecycle."""
+        """Register FastAPI events for managing the LXMF client lifecycle.
+
+        Prefer :meth:`lifespan` for new applications; FastAPI deprecates
+        ``on_event`` handlers.
+        """
 
         @app.on_event("startup")
         async def _startup() -> None:
-            client = self.get_client()
-            if attach_notifications is not None:
-                unsubscribe = await attach_notifications(client)
-                self.set_notification_unsubscriber(unsubscribe)
+            await self.startup(attach_notifications)
 
         @app.on_event("shutdown")
         async def _shutdown() -> None:
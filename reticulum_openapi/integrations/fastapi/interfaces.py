@@ -11,18 +11,20 @@ import RNS
 from RNS.Interfaces import Interface as RNSInterface
 
 
+_MODE_NAMES: Dict[int, str] = {
+    RNSInterface.Interface.MODE_FULL: "full",
+    RNSInterface.Interface.MODE_ACCESS_POINT: "access_point",
+    RNSInterface.Interface.MODE_POINT_TO_POINT: "point_to_point",
+    RNSInterface.Interface.MODE_ROAMING: "roaming",
+}
+
+
 def _resolve_interface_mode_name(mode: Optional[int]) -> Optional[str]:
     """Return a descriptive name for a Reticulum interface mode."""
 
     if mode is None:
         return None
-    mapping = {
-        RNSInterface.Interface.MODE_FULL: "full",
-        RNSInterface.Interface.MODE_ACCESS_POINT: "access_point",
-        RNSInterface.Interface.MODE_POINT_TO_POINT: "point_to_point",
-        RNSInterface.Interface.MODE_ROAMING: "roaming",
-    }
-    return mapping.get(mode, str(mode))
+    return _MODE_NAMES.get(mode, str(mode))
 
 
 def _resolve_interface_name(interface: Any, index: int) -> str:
@@ -48,17 +50,23 @@ def _coerce_optional_int(value: Any) -> Optional[int]:
 
 
 def gather_interface_status() -> List[Dict[str, Any]]:
-    """Return status metadata for all configured Reticulum interfaces."""
+    """Return status metadata for all configured Reticulum interfaces.
+
+    Only attributes already held in memory by ``RNS.Transport.interfaces`` are
+    read; no sockets or files are touched. The call is therefore safe to make
+    directly from the event loop and needs no executor offload.
+    """
 
     statuses: List[Dict[str, Any]] = []
     for index, interface in enumerate(RNS.Transport.interfaces):
+        type_name = type(interface).__name__
         mode_value = getattr(interface, "mode", None)
         bitrate_value = _coerce_optional_int(getattr(interface, "bitrate", None))
         statuses.append(
             {
-                "id": f"{type(interface).__name__}:{index}",
+                "id": f"{type_name}:{index}",
                 "name": _resolve_interface_name(interface, index),
-                "type": type(interface).__name__,
+                "type": type_name,
                 "online": bool(getattr(interface, "online", False)),
                 "mode": _resolve_interface_mode_name(mode_value),
                 "bitrate": bitrate_value,
@@ -4,46 +4,97 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import sys
 from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from datetime import timezone
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Optional
 
+import RNS
+
 from reticulum_openapi.client import LXMFClient
 
 
 logger = logging.getLogger(__name__)
 
+# Reason: ``slots`` is only accepted by ``dataclass`` from Python 3.10 onwards.
+_SLOTS_OPTION = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS_OPTION)
 class LinkStatus:
     """Describe the gateway's most recent LXMF link attempt."""
 
     state: str = "pending"
     message: Optional[str] = None
     server_identity: Optional[str] = None
-    last_attempt: Optional[datetime] = None
-    last_success: Optional[datetime] = None
+    last_attempt: Optional[str] = None
+    last_success: Optional[str] = None
     last_error: Optional[str] = None
+    retry_delay_seconds: Optional[float] = None
+    _snapshot: Optional[Dict[str, Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set ``name`` and drop the cached :meth:`to_dict` snapshot."""
+
+        # Reason: zero-argument super() is unavailable in slotted dataclasses,
+        # so the base implementation is called explicitly.
+        object.__setattr__(self, name, value)
+        if name != "_snapshot":
+            object.__setattr__(self, "_snapshot", None)
+
+    def record_failure(self, error: Exception, retry_delay_seconds: float) -> None:
+        """Record a failed attempt, deferring the human readable message.
+
+        Args:
+            error (Exception): Error raised by the link attempt.
+            retry_delay_seconds (float): Delay before the next attempt.
+        """
+
+        self.state = "connecting"
+        self.last_error = str(error)
+        self.retry_delay_seconds = retry_delay_seconds
+        # Reason: retry storms can record many failures between status polls,
+        # so the message is only formatted when the status is read.
+        self.message = None
+
+    def describe(self) -> Optional[str]:
+        """Return the status message, formatting pending failure details."""
+
+        if self.message is None and self.last_error is not None:
+            return (
+                f"Link to LXMF server {self.server_identity} failed: "
+                f"{self.last_error}. Retrying in "
+                f"{self.retry_delay_seconds or 0.0:.1f} seconds."
+            )
+        return self.message
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        """Return a serialisable mapping describing the link state."""
-
-        def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
-            if value is None:
-                return None
-            return value.astimezone(timezone.utc).isoformat()
-
-        return {
-            "state": self.state,
-            "message": self.message,
-            "serverIdentity": self.server_identity,
-            "lastAttempt": _format_timestamp(self.last_attempt),
-            "lastSuccess": _format_timestamp(self.last_success),
-            "lastError": self.last_error,
-        }
+        """Return a serialisable mapping describing the link state.
+
+        The mapping is built once per change and shared between status polls,
+        so callers must treat it as read-only.
+        """
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = {
+                "state": self.state,
+                "message": self.describe(),
+                "serverIdentity": self.server_identity,
+                "lastAttempt": self.last_attempt,
+                "lastSuccess": self.last_success,
+                "lastError": self.last_error,
+            }
+            self._snapshot = snapshot
+        return snapshot
 
 
 class LinkManager:
@@ -54,54 +105,108 @@ class LinkManager:
         client_provider: Callable[[], LXMFClient],
         *,
         retry_delay_seconds: float = 5.0,
+        initial_retry_delay_seconds: float = 1.0,
+        keepalive_interval_seconds: Optional[float] = None,
     ) -> None:
+        """Initialise the manager.
+
+        Args:
+            client_provider (Callable[[], LXMFClient]): Returns the shared client.
+            retry_delay_seconds (float): Upper bound for the backoff between
+                failed link attempts, before jitter is added.
+            initial_retry_delay_seconds (float): Delay after the first failure;
+                it doubles on each further failure and resets after success.
+            keepalive_interval_seconds (Optional[float]): When set, a
+                keepalive packet is sent over the connected link at this
+                interval. A link that is no longer active is reported and
+                rebuilt before a request needs it.
+        """
         self._client_provider = client_provider
         self._retry_delay_seconds = retry_delay_seconds
+        self._initial_retry_delay_seconds = min(
+            initial_retry_delay_seconds, retry_delay_seconds
+        )
+        self._keepalive_interval_seconds = keepalive_interval_seconds
         self._task: Optional[asyncio.Task[None]] = None
         self.status = LinkStatus()
 
     async def _ensure_link_with_retry(self, server_identity: str) -> None:
         """Continuously attempt to connect the LXMF client to the server."""
 
+        delay = self._initial_retry_delay_seconds
         while True:
-            attempt_time = datetime.now(timezone.utc)
+            attempt_time = datetime.now(timezone.utc).isoformat()
             self.status.last_attempt = attempt_time
             try:
                 client = self._client_provider()
-                await client.ensure_link(server_identity)
+                link = await client.ensure_link(server_identity)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # pragma: no cover - defensive logging
-                self._record_link_failure(server_identity, exc)
-                await asyncio.sleep(self._retry_delay_seconds)
-            else:
-                self._record_link_success(server_identity, attempt_time)
+                # Reason: transient outages recover after a short wait, while
+                # the doubling cap and jitter keep many gateways from
+                # reconnecting to the same server in lockstep.
+                wait = delay + random.uniform(0, 0.5 * delay)
+                self._record_link_failure(server_identity, exc, wait)
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, self._retry_delay_seconds)
+                continue
+
+            delay = self._initial_retry_delay_seconds
+            self._record_link_success(server_identity, attempt_time)
+            if self._keepalive_interval_seconds is None:
                 break
+            await self._keep_link_alive(link, server_identity)
+
+    async def _keep_link_alive(self, link: RNS.Link, server_identity: str) -> None:
+        """Probe ``link`` every keepalive interval until it stops being active."""
 
-    def _record_link_failure(self, server_identity: str, error: Exception) -> None:
+        while True:
+            await asyncio.sleep(self._keepalive_interval_seconds)
+            if link.status != RNS.Link.ACTIVE:
+                self._record_link_lost(server_identity, "link closed")
+                return
+            try:
+                # Reason: a keepalive packet is the cheapest real send on a
+                # link, so a dead path is noticed without a full request.
+                link.send_keepalive()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self._record_link_lost(server_identity, str(exc))
+                return
+
+    def _record_link_failure(
+        self, server_identity: str, error: Exception, retry_delay_seconds: float
+    ) -> None:
         """Update the link status after a failed connection attempt."""
 
+        self.status.record_failure(error, retry_delay_seconds)
+        logger.warning(
+            "LXMF link to server %s failed: %s; retrying in %.1fs",
+            server_identity,
+            error,
+            retry_delay_seconds,
+        )
+
+    def _record_link_lost(self, server_identity: str, reason: str) -> None:
+        """Mark a previously connected link as reconnecting."""
+
         self.status.state = "connecting"
-        self.status.last_error = str(error)
+        self.status.last_error = reason
         self.status.message = (
-            "Link to LXMF server "
-            f"{server_identity} failed: {error}. "
-            f"Retrying in {self._retry_delay_seconds:.1f} seconds."
+            f"Link to LXMF server {server_identity} lost: {reason}. Reconnecting."
         )
-        logger.warning("LXMF link to server %s failed: %s", server_identity, error)
+        logger.warning("LXMF link to server %s lost: %s", server_identity, reason)
 
-    def _record_link_success(
-        self, server_identity: str, attempt_time: datetime
-    ) -> None:
+    def _record_link_success(self, server_identity: str, attempt_time: str) -> None:
         """Update link status and log a successful connection."""
 
+        was_connected = self.status.state == "connected"
         self.status.state = "connected"
         self.status.last_success = attempt_time
         self.status.last_error = None
-        message = f"Connected to LXMF server {server_identity}"
-        self.status.message = message
-        print(f"[Reticulum FastAPI] {message}")
-        logger.info("Established LXMF link with server %s", server_identity)
+        self.status.message = f"Connected to LXMF server {server_identity}"
+        if not was_connected:
+            logger.info("Connected to LXMF server %s", server_identity)
 
     def start(self, server_identity: Optional[str]) -> None:
         """Begin the background retry loop for the configured server identity."""
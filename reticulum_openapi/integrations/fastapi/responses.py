@@ -0,0 +1,67 @@
+"""Response classes used by Reticulum FastAPI gateways."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any
+from typing import Collection
+from typing import Mapping
+from typing import Tuple
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the field names declared by dataclass ``cls``."""
+
+    return tuple(field.name for field in fields(cls))
+
+
+def _default(value: Any) -> Any:
+    """Encode values orjson does not handle natively.
+
+    Dataclasses are emitted without their ``None`` fields to match
+    :func:`reticulum_openapi.conversion.normalise_response`.
+    """
+
+    if is_dataclass(value) and not isinstance(value, type):
+        result = {}
+        for name in _field_names(type(value)):
+            field_value = getattr(value, name)
+            if field_value is not None:
+                result[name] = field_value
+        return result
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Collection) and not isinstance(value, (str, bytes)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with :mod:`orjson` instead of :mod:`json`.
+
+    Decoded LXMF payloads can be large lists of records, so serialising them
+    with orjson keeps list endpoints from being dominated by encoding time.
+    Dataclass responses can be passed directly and are rendered the same way
+    :func:`reticulum_openapi.conversion.normalise_response` would shape them.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Return ``content`` encoded as compact UTF-8 JSON bytes."""
+
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+__all__ = ["ORJSONResponse"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 from functools import lru_cache
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Callable
 from typing import Dict
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from pydantic import Field
@@ -92,8 +92,8 @@ def _load_config_from_json(raw_json: str) -> Dict[str, Any]:
     """Return configuration data parsed from a raw JSON string."""
 
     try:
-        parsed = json.loads(raw_json)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive logging
+        parsed = orjson.loads(raw_json)
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive logging
         raise ValueError("Invalid JSON supplied via environment variable") from exc
 
     if not isinstance(parsed, dict):
@@ -107,8 +107,7 @@ def _load_config_from_path(path: Path) -> Dict[str, Any]:
 
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(path.read_bytes())
 
 
 def load_lxmf_client_settings(
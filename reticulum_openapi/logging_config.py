@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging as _logging
+from typing import IO
 from typing import Iterable
+from typing import Optional
 
 PACKAGE_LOGGER_NAME = "reticulum_openapi"
 _DEFAULT_LOG_LEVEL = _logging.INFO
@@ -19,20 +21,29 @@ def _handler_exists(handlers: Iterable[_logging.Handler]) -> bool:
     return False
 
 
-def configure_logging(level: int = _DEFAULT_LOG_LEVEL) -> _logging.Logger:
+def configure_logging(
+    level: int = _DEFAULT_LOG_LEVEL,
+    *,
+    logger_name: str = PACKAGE_LOGGER_NAME,
+    stream: Optional[IO[str]] = None,
+) -> _logging.Logger:
     """Configure and return the package logger.
 
     Args:
         level (int): Logging level applied to the package logger. Defaults to
             :data:`logging.INFO`.
+        logger_name (str): Name of the logger to configure. Defaults to the
+            package logger so applications can reuse the shared format.
+        stream (Optional[IO[str]]): Stream receiving log records. Defaults to
+            :data:`sys.stderr`.
 
     Returns:
         logging.Logger: The shared package logger instance.
     """
-    logger = _logging.getLogger(PACKAGE_LOGGER_NAME)
+    logger = _logging.getLogger(logger_name)
     logger.setLevel(level)
     if not _handler_exists(logger.handlers):
-        handler = _logging.StreamHandler()
+        handler = _logging.StreamHandler(stream)
         handler.set_name(_HANDLER_NAME)
         handler.setFormatter(_logging.Formatter(_LOG_FORMAT))
         logger.addHandler(handler)
@@ -6,6 +6,7 @@ from dataclasses import is_dataclass
 import json
 import zlib
 import sys
+from typing import AsyncIterator
 from typing import List
 from typing import Optional
 from typing import Type
@@ -170,8 +171,6 @@ def dataclass_to_msgpack(data_obj: T) -> bytes:
     Returns:
         bytes: Canonical MessagePack representation.
     """
-    if is_dataclass(data_obj):
-        data_obj = asdict(data_obj)
     return to_canonical_bytes(data_obj)
 
 
@@ -290,14 +289,8 @@ class BaseModel:
         return cls.from_orm(orm_obj)
 
     @classmethod
-    async def list(cls, session: AsyncSession, **filters) -> List[T]:
-        """List records matching given filters.
-
-        Filters should correspond to model attributes.
-
-        Returns:
-            List[T]: Dataclass instances matching the filters.
-        """
+    def _select(cls, filters: dict):
+        """Return a ``SELECT`` for the ORM model restricted by ``filters``."""
         if cls.__orm_model__ is None:
             raise NotImplementedError(
                 "Subclasses must define __orm_model__ for persistence"
@@ -305,9 +298,57 @@ class BaseModel:
         stmt = select(cls.__orm_model__)
         for attr, value in filters.items():
             stmt = stmt.where(getattr(cls.__orm_model__, attr) == value)
+        return stmt
+
+    @classmethod
+    async def list(
+        cls,
+        session: AsyncSession,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **filters,
+    ) -> List[T]:
+        """List records matching given filters.
+
+        Filters should correspond to model attributes.
+
+        Args:
+            session (AsyncSession): Database session.
+            limit (Optional[int]): Maximum number of records to return.
+            offset (Optional[int]): Number of records to skip first.
+            **filters: Attribute values records must match.
+
+        Returns:
+            List[T]: Dataclass instances matching the filters.
+        """
+        stmt = cls._select(filters)
+        if limit is not None or offset is not None:
+            # Reason: pages are only stable when rows come back in a fixed order.
+            stmt = stmt.order_by(*cls.__orm_model__.__table__.primary_key.columns)
+            stmt = stmt.limit(limit).offset(offset)
         result = await session.execute(stmt)
         return [cls.from_orm(obj) for obj in result.scalars().all()]
 
+    @classmethod
+    async def stream(
+        cls, session: AsyncSession, *, batch_size: int = 200, **filters
+    ) -> AsyncIterator[T]:
+        """Yield records matching ``filters`` without loading them all at once.
+
+        Args:
+            session (AsyncSession): Database session.
+            batch_size (int): Rows fetched from the cursor per round-trip.
+            **filters: Attribute values records must match.
+
+        Yields:
+            T: Dataclass instances matching the filters.
+        """
+        stmt = cls._select(filters).execution_options(yield_per=batch_size)
+        result = await session.stream_scalars(stmt)
+        async for obj in result:
+            yield cls.from_orm(obj)
+
     @classmethod
     async def update(cls, session: AsyncSession, id_, **kwargs) -> Optional[T]:
         """Update fields on a record by primary key.
@@ -33,8 +33,6 @@ from .model import dataclass_from_msgpack
 from .model import dataclass_to_json_bytes
 from .model import dataclass_to_msgpack
 
-_ = _mp_compat  # ensure side-effect import is retained for linters
-
 configure_logging()
 logger = logging.getLogger(__name__)
 
@@ -848,6 +846,9 @@ class LXMFService:
 
     async def start(self):
         """Run the service until cancelled."""
+        # Reason: the guard patches multiprocessing for the whole process, so it
+        # is only installed once an application actually runs the service.
+        _mp_compat.install()
         logger.info("LXMFService started and listening for messages...")
         self._start_task = asyncio.current_task()
         try:
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
 from dataclasses import asdict
-from typing import Any, Callable, Optional, Type, TypeVar
+from dataclasses import fields
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 from .model import BaseModel
 
@@ -13,6 +16,27 @@ ModelT = TypeVar("ModelT", bound=BaseModel)
 SessionFactory = Callable[[], AbstractAsyncContextManager[Any]]
 
 
+@lru_cache(maxsize=None)
+def _field_names(model: type) -> Tuple[str, ...]:
+    """Return the dataclass field names of ``model``."""
+
+    return tuple(field.name for field in fields(model))
+
+
+def _payload_values(payload: Any) -> Dict[str, Any]:
+    """Return the field values of ``payload`` as keyword arguments.
+
+    Flat dataclasses are copied field by field. ``asdict`` is only used when a
+    value is a container or nested dataclass that it would convert.
+    """
+
+    values = {name: getattr(payload, name) for name in _field_names(type(payload))}
+    for value in values.values():
+        if isinstance(value, (list, tuple, dict)) or is_dataclass(value):
+            return asdict(payload)
+    return values
+
+
 class SQLAlchemyControllerMixin:
     """Provide reusable async CRUD helpers for SQLAlchemy-backed controllers."""
 
@@ -88,7 +112,7 @@ class SQLAlchemyControllerMixin:
 
         session_factory = self._require_session_factory()
         async with session_factory() as session:
-            return await model.create(session, **asdict(payload))
+            return await model.create(session, **_payload_values(payload))
 
     async def _update_instance(
         self,
@@ -101,7 +125,7 @@ class SQLAlchemyControllerMixin:
         identifier = getattr(payload, identifier_name)
         session_factory = self._require_session_factory()
         async with session_factory() as session:
-            return await model.update(session, identifier, **asdict(payload))
+            return await model.update(session, identifier, **_payload_values(payload))
 
     async def _retrieve_instance(
         self,
@@ -123,9 +147,15 @@ class SQLAlchemyControllerMixin:
         async with session_factory() as session:
             return await model.delete(session, resolved_identifier)
 
-    async def _list_instances(self, model: Type[ModelT]) -> list[ModelT]:
-        """Return all stored instances for ``model``."""
+    async def _list_instances(
+        self,
+        model: Type[ModelT],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[ModelT]:
+        """Return stored instances for ``model``, optionally one page of them."""
 
         session_factory = self._require_session_factory()
         async with session_factory() as session:
-            return await model.list(session)
+            return await model.list(session, limit=limit, offset=offset)
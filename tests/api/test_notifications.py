@@ -37,8 +37,9 @@ async def test_unsolicited_message_broadcasts_to_subscribers():
     payload = to_canonical_bytes({"event": "test", "status": "ok"})
     message = SimpleNamespace(title="EmergencyUpdate", content=payload)
     client._callback(message)
-    raw = await asyncio.wait_for(queue.get(), timeout=1.0)
-    data = json.loads(raw)
+    frame = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    data = json.loads(frame[len(b"data: "):])
 
     await unsubscribe()
     await notifications.notification_hub.remove_subscriber(queue)
@@ -59,8 +60,9 @@ async def test_binary_payload_falls_back_to_base64():
 
     message = SimpleNamespace(title="EmergencyBinary", content=b"\xff\x00")
     client._callback(message)
-    raw = await asyncio.wait_for(queue.get(), timeout=1.0)
-    data = json.loads(raw)
+    frame = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    data = json.loads(frame[len(b"data: "):])
 
     await unsubscribe()
     await notifications.notification_hub.remove_subscriber(queue)
@@ -80,16 +82,16 @@ async def test_event_stream_yields_sse_payloads():
     disconnect = asyncio.Event()
 
     class StubRequest:
-        async def is_disconnected(self) -> bool:
-            return disconnect.is_set()
+        async def receive(self):
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
 
     request = StubRequest()
     stream = notifications._event_stream(request, queue)  # type: ignore[attr-defined]
 
-    payload = json.dumps({"title": "Ping"})
-    await queue.put(payload)
+    await notifications.notification_hub.broadcast({"title": "Ping"})
     line = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
-    assert line == f"data: {payload}\n\n"
+    assert line == b'data: {"title":"Ping"}\n\n'
 
     disconnect.set()
     with pytest.raises(StopAsyncIteration):
@@ -117,3 +119,133 @@ async def test_unsubscribe_prevents_additional_broadcasts(monkeypatch):
     client._callback(message)
     await asyncio.sleep(0.05)
     assert calls["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_one_encoded_frame():
+    """Every subscriber should receive the same pre-encoded SSE frame."""
+
+    await notifications.notification_hub.reset()
+    first = await notifications.notification_hub.add_subscriber()
+    second = await notifications.notification_hub.add_subscriber()
+
+    await notifications.notification_hub.broadcast({"title": "Shared"})
+
+    frame = first.get_nowait()
+    assert frame is second.get_nowait()
+    assert frame == b'data: {"title":"Shared"}\n\n'
+
+    await notifications.notification_hub.reset()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_keeps_newest_frames():
+    """A full subscriber buffer should drop its oldest frames."""
+
+    hub = notifications.NotificationHub()
+    subscriber = await hub.add_subscriber(queue_size=2)
+
+    for index in range(3):
+        await hub.broadcast({"index": index})
+
+    assert subscriber.dropped == 1
+
+    assert subscriber.get_nowait() == b'data: {"index":1}\n\n'
+    assert await subscriber.get() == b'data: {"index":2}\n\n'
+    with pytest.raises(asyncio.QueueEmpty):
+        subscriber.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_zero_queue_size_keeps_every_frame():
+    """A hub queue size of zero should leave subscriber buffers unbounded."""
+
+    hub = notifications.NotificationHub(queue_size=0)
+    subscriber = await hub.add_subscriber()
+
+    for index in range(3):
+        await hub.broadcast({"index": index})
+
+    assert subscriber.dropped == 0
+    assert [subscriber.get_nowait() for _ in range(3)] == [
+        f'data: {{"index":{index}}}\n\n'.encode() for index in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("queue_size", [0, -1])
+async def test_subscriber_override_below_one_is_unbounded(queue_size, caplog):
+    """Per-subscriber sizes below one should not drop frames or warn."""
+
+    hub = notifications.NotificationHub(queue_size=1)
+    bounded = await hub.add_subscriber()
+    unbounded = await hub.add_subscriber(queue_size=queue_size)
+
+    with caplog.at_level("WARNING", logger=notifications.logger.name):
+        await hub.broadcast({"index": 0})
+        assert not caplog.records
+        await hub.broadcast({"index": 1})
+
+    assert unbounded.dropped == 0
+    assert unbounded.get_nowait() == b'data: {"index":0}\n\n'
+    assert unbounded.get_nowait() == b'data: {"index":1}\n\n'
+    assert bounded.dropped == 1
+    assert bounded.get_nowait() == b'data: {"index":1}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_event_stream_batches_pending_frames():
+    """Frames already waiting should be sent in a single chunk."""
+
+    hub = notifications.NotificationHub()
+    subscriber = await hub.add_subscriber()
+
+    class StubRequest:
+        async def receive(self):
+            await asyncio.Event().wait()
+
+    await hub.broadcast({"n": 1})
+    await hub.broadcast({"n": 2})
+    stream = notifications._event_stream(StubRequest(), subscriber)  # type: ignore[arg-type]
+
+    chunk = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+    await stream.aclose()
+
+    assert chunk == b'data: {"n":1}\n\ndata: {"n":2}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_binary_and_non_string_keys():
+    """Frames should base64 binary values and stringify map keys."""
+
+    hub = notifications.NotificationHub()
+    subscriber = await hub.add_subscriber()
+
+    await hub.broadcast({"payload": {1: b"\xff\x00", "raw": {b"k": "v"}}})
+    await hub.broadcast({"payload": {"blob": b"\xff\x00"}})
+
+    assert json.loads(subscriber.get_nowait()[len(b"data: "):]) == {
+        "payload": {"1": "/wA=", "raw": {"b'k'": "v"}}
+    }
+    assert subscriber.get_nowait() == b'data: {"payload":{"blob":"/wA="}}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_keepalive_when_idle():
+    """Idle streams should emit an SSE comment and keep the pending read."""
+
+    hub = notifications.NotificationHub()
+    subscriber = await hub.add_subscriber()
+
+    class StubRequest:
+        async def receive(self):
+            await asyncio.Event().wait()
+
+    stream = notifications._event_stream(  # type: ignore[arg-type]
+        StubRequest(), subscriber, keepalive_seconds=0.01
+    )
+
+    assert await asyncio.wait_for(stream.__anext__(), timeout=1.0) == b": keep-alive\n\n"
+    await hub.broadcast({"n": 1})
+    assert await asyncio.wait_for(stream.__anext__(), timeout=1.0) == b'data: {"n":1}\n\n'
+    await stream.aclose()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib
 import json
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -131,7 +132,7 @@ async def test_register_client_events_lifecycle(monkeypatch):
     for handler in app.router.on_startup:
         await handler()
 
-    client = deps.get_lxmf_client()
+    client = await deps.get_lxmf_client()
     assert isinstance(client, DummyClient)
     assert client.display_name == config_data["client_display_name"]
     assert client.timeout == config_data["request_timeout_seconds"]
@@ -141,7 +142,7 @@ async def test_register_client_events_lifecycle(monkeypatch):
         await handler()
 
     assert DummyClient.instance.stopped is True
-    new_client = deps.get_lxmf_client()
+    new_client = await deps.get_lxmf_client()
     assert isinstance(new_client, DummyClient)
     assert new_client is not client
 
@@ -174,14 +175,12 @@ def north_api_test_client(monkeypatch):
         def get_server_identity(self) -> str:
             return "0011223344556677"
 
-        def register_events(self, app, attach_notifications=None):
-            @app.on_event("startup")
-            async def _startup() -> None:
-                return None
+        def lifespan(self, attach_notifications=None):
+            @asynccontextmanager
+            async def _lifespan(app):
+                yield
 
-            @app.on_event("shutdown")
-            async def _shutdown() -> None:
-                return None
+            return _lifespan
 
     deps_module._client_manager = StubManager()
 
@@ -349,3 +348,14 @@ def test_list_events_returns_serialised_payload(north_api_test_client, monkeypat
     assert args[0] is stub_client
     assert isinstance(args[1], str)
     assert args[1]
+
+
+def test_client_status_resolves_async_dependencies(north_api_test_client):
+    """The client status route should resolve the coroutine dependencies."""
+
+    client, _routes_module, _stub_client = north_api_test_client
+
+    response = client.get("/client/status")
+
+    assert response.status_code == 200
+    assert response.json() == {"server_identity_hash": "0011223344556677"}
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import json
+import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import List
 from unittest.mock import AsyncMock
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 import RNS
 
@@ -117,6 +123,8 @@ def gateway_app(monkeypatch):
 
     module._SETTINGS_LOADER.cache_clear()
     module._INTERFACE_STATUS = []
+    module._INTERFACE_STATUS_JSON = b"[]"
+    module._INTERFACE_STATUS_TS = 0.0
 
 
 def test_default_identity_uses_json_config(monkeypatch) -> None:
@@ -145,6 +153,27 @@ def test_default_identity_uses_json_config(monkeypatch) -> None:
     importlib.reload(module)
 
 
+def test_link_destination_rejects_updates_for_env_config(monkeypatch) -> None:
+    """Environment-sourced configuration should be reported as read-only."""
+
+    monkeypatch.setenv(
+        "NORTH_API_CONFIG_JSON", json.dumps({"server_identity_hash": SERVER_IDENTITY})
+    )
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    module = importlib.reload(module)
+    client = TestClient(module.app)
+
+    current = client.get("/link-destination").json()
+    response = client.put("/link-destination", json={"serverIdentity": SERVER_IDENTITY})
+
+    assert current["configurable"] is False
+    assert current["configPath"] is None
+    assert response.status_code == 503
+
+    monkeypatch.delenv("NORTH_API_CONFIG_JSON", raising=False)
+    importlib.reload(module)
+
+
 def test_create_emergency_action_message_routes_payload(gateway_app) -> None:
     """Creating an EAM should convert payloads to dataclasses and decode responses."""
 
@@ -367,6 +396,7 @@ def test_cors_preflight_allows_custom_headers(gateway_app) -> None:
     assert allow_origin in {"*", "http://localhost:5173"}
     allow_headers = response.headers.get("access-control-allow-headers", "").lower()
     assert "*" in allow_headers or "x-server-identity" in allow_headers
+    assert response.headers.get("access-control-max-age") == "86400"
 
 
 def test_timeout_returns_gateway_timeout(gateway_app) -> None:
@@ -407,6 +437,7 @@ def test_gateway_status_returns_version_and_uptime(gateway_app) -> None:
     assert response.status_code == 200
     payload = response.json()
     assert payload["version"] == module._GATEWAY_VERSION
+    assert payload["startedAt"] == module._START_TIME_ISO
     assert isinstance(payload["uptime"], str)
     assert payload["uptime"].count(":") == 2
     assert payload["serverIdentity"] == module._CLIENT_MANAGER.get_server_identity()
@@ -419,6 +450,92 @@ def test_gateway_status_returns_version_and_uptime(gateway_app) -> None:
     assert payload["lxmfStoragePath"] == settings.lxmf_storage_path
     assert payload["allowedOrigins"] == module._ALLOWED_ORIGINS
     assert payload["linkStatus"] == module._LINK_MANAGER.status.to_dict()
+    assert response.headers["content-type"] == "application/json"
+    assert module._STATUS_PREFIX.startswith(b'{"version":')
+    status_model = module.GatewayStatus.model_validate(payload)
+    assert status_model.reticulumInterfaces[0].name == "Local Gateway"
+
+
+def test_link_destination_returns_current_identity(gateway_app) -> None:
+    """The link destination endpoint should describe the configured server."""
+
+    module, client, _stub = gateway_app
+
+    response = client.get("/link-destination")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    payload = response.json()
+    assert payload["serverIdentity"] == module._DEFAULT_SERVER_IDENTITY
+    assert payload["linkStatus"]["state"] == module._LINK_STATUS.state
+    assert payload["configurable"] is module._CONFIG_MUTABLE
+    assert response.content.startswith(module._LINK_DESTINATION_PREFIX)
+
+
+def test_gateway_status_reuses_fresh_interface_snapshot(
+    gateway_app, monkeypatch
+) -> None:
+    """Status polls within the TTL should not gather interfaces again."""
+
+    module, client, _stub = gateway_app
+    calls = []
+
+    def fake_gather():
+        calls.append(True)
+        return [{"name": f"Interface-{len(calls)}"}]
+
+    monkeypatch.setattr(module, "gather_interface_status", fake_gather)
+    module._force_refresh_interface_status()
+
+    first = client.get("/").json()
+    second = client.get("/").json()
+
+    assert len(calls) == 1
+    assert first["reticulumInterfaces"] == second["reticulumInterfaces"]
+
+    module._INTERFACE_STATUS_TS -= module._INTERFACE_STATUS_TTL_SECONDS
+    refreshed = client.get("/").json()
+    assert len(calls) == 2
+    assert refreshed["reticulumInterfaces"] == [{"name": "Interface-2"}]
+
+
+def test_concurrent_gateway_status_polls_share_one_scan(
+    gateway_app, monkeypatch
+) -> None:
+    """Concurrent status polls on a stale cache should trigger a single scan."""
+
+    module, _client, _stub = gateway_app
+    calls = []
+
+    def fake_gather():
+        calls.append(True)
+        return [{"name": "Interface-0"}]
+
+    monkeypatch.setattr(module, "gather_interface_status", fake_gather)
+    module._INTERFACE_STATUS_TS = float("-inf")
+
+    async def _poll() -> None:
+        await asyncio.gather(*(module.get_gateway_status() for _ in range(8)))
+
+    asyncio.run(_poll())
+
+    assert len(calls) == 1
+
+
+def test_gateway_status_regathers_empty_interface_snapshot(
+    gateway_app, monkeypatch
+) -> None:
+    """An empty interface snapshot should not be served from the cache."""
+
+    module, client, _stub = gateway_app
+    snapshots = [[], [{"name": "Late Interface"}]]
+
+    monkeypatch.setattr(module, "gather_interface_status", lambda: snapshots.pop(0))
+    module._force_refresh_interface_status()
+
+    payload = client.get("/").json()
+
+    assert payload["reticulumInterfaces"] == [{"name": "Late Interface"}]
 
 
 def test_link_failure_reported_in_status(monkeypatch) -> None:
@@ -457,14 +574,14 @@ def test_link_failure_reported_in_status(monkeypatch) -> None:
     status = module._LINK_MANAGER.status
     assert status.state == "connecting"
     assert status.last_error == "no link"
-    assert "Retrying" in (status.message or "")
+    assert "Retrying" in (status.to_dict()["message"] or "")
     assert status.last_attempt is not None
 
     monkeypatch.delenv("NORTH_API_CONFIG_JSON", raising=False)
 
 
-def test_successful_link_prints_console_message(monkeypatch) -> None:
-    """A successful link attempt should emit a console message."""
+def test_successful_link_logs_console_message(monkeypatch) -> None:
+    """A successful link attempt should emit a log message."""
 
     config_json = json.dumps({"server_identity_hash": SERVER_IDENTITY})
     monkeypatch.setenv("NORTH_API_CONFIG_JSON", config_json)
@@ -472,13 +589,15 @@ def test_successful_link_prints_console_message(monkeypatch) -> None:
     module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
     module = importlib.reload(module)
 
-    printed: List[str] = []
+    logged: List[str] = []
 
-    def _capture_print(*args, **kwargs) -> None:
-        message = " ".join(str(arg) for arg in args)
-        printed.append(message)
+    class _CaptureHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            logged.append(record.getMessage())
 
-    monkeypatch.setattr("builtins.print", _capture_print)
+    link_logger = logging.getLogger("reticulum_openapi.integrations.fastapi.link")
+    handler = _CaptureHandler()
+    link_logger.addHandler(handler)
 
     class SuccessfulClient:
         _normalise_destination_hex = staticmethod(
@@ -500,10 +619,261 @@ def test_successful_link_prints_console_message(monkeypatch) -> None:
 
     monkeypatch.setattr(module, "LXMFClient", SuccessfulClient)
 
-    with TestClient(module.app):
-        time.sleep(0.05)
+    try:
+        with TestClient(module.app):
+            time.sleep(0.05)
+    finally:
+        link_logger.removeHandler(handler)
 
-    assert any("Connected to LXMF server" in message for message in printed)
+    assert any("Connected to LXMF server" in message for message in logged)
     assert module._LINK_MANAGER.status.state == "connected"
 
     monkeypatch.delenv("NORTH_API_CONFIG_JSON", raising=False)
+
+
+def test_create_emergency_action_message_requires_callsign(gateway_app) -> None:
+    """Typed request bodies should reject payloads missing the identifier."""
+
+    _module, client, stub = gateway_app
+
+    response = client.post(
+        "/emergency-action-messages",
+        params={"server_identity": SERVER_IDENTITY},
+        json={"groupName": "Team"},
+    )
+
+    assert response.status_code == 422
+    stub.send_command.assert_not_awaited()
+
+
+def test_shared_client_created_once_under_concurrency(monkeypatch) -> None:
+    """Concurrent first calls must share a single LXMF client instance."""
+
+    monkeypatch.setenv(
+        "NORTH_API_CONFIG_JSON", json.dumps({"server_identity_hash": SERVER_IDENTITY})
+    )
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    module = importlib.reload(module)
+
+    created: List[object] = []
+
+    class SlowClient:
+        def __init__(self, *args, **kwargs) -> None:
+            time.sleep(0.02)
+            created.append(self)
+
+        def announce(self) -> None:
+            return None
+
+    monkeypatch.setattr(module, "LXMFClient", SlowClient)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: module.get_shared_client(), range(4)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+    monkeypatch.delenv("NORTH_API_CONFIG_JSON", raising=False)
+
+
+def test_load_gateway_config_falls_back_on_invalid_json(monkeypatch, tmp_path) -> None:
+    """Malformed inline JSON should fall back to the configured file path."""
+
+    config_path = tmp_path / "client_config.json"
+    config_path.write_text(
+        json.dumps({"server_identity_hash": SERVER_IDENTITY}), encoding="utf-8"
+    )
+    monkeypatch.setenv("NORTH_API_CONFIG_JSON", "{not json")
+    monkeypatch.setenv("NORTH_API_CONFIG_PATH", str(config_path))
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+
+    data = module._load_gateway_config()
+
+    assert data == {"server_identity_hash": SERVER_IDENTITY}
+    assert module._CONFIG_SOURCE_PATH == config_path
+
+
+def test_config_writes_coalesce_bursts(monkeypatch, tmp_path) -> None:
+    """Updates queued during a write should collapse into one follow-up write."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    written: List[dict] = []
+
+    def slow_write(data, path):
+        time.sleep(0.05)
+        written.append(dict(data))
+        return path
+
+    monkeypatch.setattr(module, "write_client_config", slow_write)
+    monkeypatch.setattr(module, "_CONFIG_SOURCE_PATH", tmp_path / "config.json")
+
+    async def _burst() -> None:
+        await asyncio.gather(
+            *(module._write_gateway_config({"value": index}) for index in range(4))
+        )
+
+    asyncio.run(_burst())
+
+    assert written[-1] == {"value": 3}
+    assert len(written) <= 2
+
+
+def test_persist_gateway_config_writes_off_the_event_loop(
+    monkeypatch, tmp_path
+) -> None:
+    """Config writes should run outside the event loop thread."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    writer_threads: List[int] = []
+
+    def record_write(data, path):
+        writer_threads.append(threading.get_ident())
+        return path
+
+    monkeypatch.setattr(module, "write_client_config", record_write)
+    monkeypatch.setattr(module, "_CONFIG_SOURCE_PATH", tmp_path / "config.json")
+
+    asyncio.run(module._persist_gateway_config({"value": 1}))
+
+    assert writer_threads and writer_threads[0] != threading.get_ident()
+
+    monkeypatch.setattr(module, "_CONFIG_SOURCE_PATH", None)
+    with pytest.raises(RuntimeError):
+        asyncio.run(module._persist_gateway_config({"value": 2}))
+
+
+def test_update_server_identity_rolls_back_on_write_failure(monkeypatch) -> None:
+    """A failed persist should restore the previous in-memory identity."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    config = {"server_identity_hash": SERVER_IDENTITY}
+    monkeypatch.setattr(module, "_CONFIG_STORE", config)
+    monkeypatch.setattr(module, "_CONFIG_DATA", MappingProxyType(config))
+    monkeypatch.setattr(module, "_CONFIG_SOURCE_PATH", None)
+
+    with pytest.raises(HTTPException):
+        asyncio.run(module._update_server_identity("ab" * 16))
+
+    assert config == {"server_identity_hash": SERVER_IDENTITY}
+    with pytest.raises(TypeError):
+        module._CONFIG_DATA["server_identity_hash"] = "ab" * 16
+
+
+def test_update_server_identity_serialises_failed_overlapping_updates(
+    monkeypatch, tmp_path
+) -> None:
+    """Overlapping updates whose writes fail should leave the original identity."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    config = {"server_identity_hash": SERVER_IDENTITY}
+    monkeypatch.setattr(module, "_CONFIG_STORE", config)
+    monkeypatch.setattr(module, "_CONFIG_DATA", MappingProxyType(config))
+    monkeypatch.setattr(module, "_CONFIG_SOURCE_PATH", tmp_path / "config.json")
+    monkeypatch.setattr(module, "_DEFAULT_SERVER_IDENTITY", SERVER_IDENTITY)
+
+    def failing_write(data, path):
+        time.sleep(0.02)
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(module, "write_client_config", failing_write)
+
+    async def _overlap() -> List[object]:
+        # Reason: the lock must belong to this test's event loop.
+        monkeypatch.setattr(module, "_CONFIG_UPDATE_LOCK", asyncio.Lock())
+        return await asyncio.gather(
+            module._update_server_identity("ab" * 16),
+            module._update_server_identity("cd" * 16),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_overlap())
+
+    assert all(isinstance(result, HTTPException) for result in results)
+    assert config == {"server_identity_hash": SERVER_IDENTITY}
+    assert module._DEFAULT_SERVER_IDENTITY == SERVER_IDENTITY
+
+
+def test_gateway_import_keeps_event_loop_policy() -> None:
+    """Importing the gateway should not replace the event loop policy."""
+
+    policy = asyncio.get_event_loop_policy()
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    importlib.reload(module)
+
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_extract_server_identity_uses_memoised_normalisation() -> None:
+    """Repeated identities should resolve through the shared hex cache."""
+
+    from reticulum_openapi import client as client_module
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    client_module._normalise_hex_string.cache_clear()
+
+    first = module._extract_server_identity({"serverIdentity": SERVER_IDENTITY.upper()})
+    second = module._extract_server_identity({"serverIdentity": SERVER_IDENTITY.upper()})
+
+    assert first == second == SERVER_IDENTITY.lower()
+    assert client_module._normalise_hex_string.cache_info().hits == 1
+
+
+def test_command_routes_cover_every_command_spec() -> None:
+    """Each command spec should be exposed by exactly one generated route."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+
+    routed = sorted(route.spec_key for route in module._COMMAND_ROUTES)
+    names = {getattr(route, "name", None) for route in module.app.routes}
+
+    assert routed == sorted(module._COMMAND_SPECS)
+    assert {route.name for route in module._COMMAND_ROUTES} <= names
+
+
+def test_parse_allowed_origins_strips_and_drops_blanks() -> None:
+    """Origins should be trimmed and empty entries ignored."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+
+    assert module._parse_allowed_origins(None) == []
+    assert module._parse_allowed_origins(" https://a.test , ,https://b.test,") == [
+        "https://a.test",
+        "https://b.test",
+    ]
+
+
+def test_enable_eager_tasks_installs_factory_when_available(monkeypatch) -> None:
+    """The eager task factory should be installed only when Python provides it."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+
+    class RecordingLoop:
+        def __init__(self) -> None:
+            self.factory = None
+
+        def set_task_factory(self, factory) -> None:
+            self.factory = factory
+
+    def fake_factory(loop, coro, **kwargs):
+        return None
+
+    loop = RecordingLoop()
+    monkeypatch.setattr(module.asyncio, "eager_task_factory", fake_factory, raising=False)
+    assert module._enable_eager_tasks(loop) is True
+    assert loop.factory is fake_factory
+
+    monkeypatch.delattr(module.asyncio, "eager_task_factory")
+    other_loop = RecordingLoop()
+    assert module._enable_eager_tasks(other_loop) is False
+    assert other_loop.factory is None
+
+
+def test_format_uptime_reuses_string_within_a_second() -> None:
+    """Uptime formatting should reuse the string while the second is unchanged."""
+
+    module = importlib.import_module("examples.EmergencyManagement.web_gateway.app")
+    module._format_whole_seconds.cache_clear()
+
+    assert module._format_uptime(3723.2) == "01:02:03"
+    assert module._format_uptime(3723.9) == "01:02:03"
+    assert module._format_uptime(-5) == "00:00:00"
+    assert module._format_whole_seconds.cache_info().hits == 1
@@ -1,23 +1,36 @@
 import asyncio
+import sys
+from dataclasses import dataclass
+from enum import Enum
 from types import SimpleNamespace
 from typing import Awaitable
 from typing import Callable
+from typing import List
+from typing import Optional
 
 import pytest
 from fastapi import FastAPI
 from fastapi import HTTPException
 from fastapi import status
+from pydantic import BaseModel
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock
+from unittest.mock import Mock
 
+import orjson
 import RNS
 
 from reticulum_openapi.integrations.fastapi import CommandSpec
 from reticulum_openapi.integrations.fastapi import LXMFClientManager
+from reticulum_openapi.integrations.fastapi import LXMFCommandContext
 from reticulum_openapi.integrations.fastapi import LinkManager
+from reticulum_openapi.integrations.fastapi import LinkStatus
+from reticulum_openapi.integrations.fastapi import ORJSONResponse
+from reticulum_openapi.integrations.fastapi import ORJSONRoute
 from reticulum_openapi.integrations.fastapi import create_command_context_dependency
 from reticulum_openapi.integrations.fastapi import gather_interface_status
 from reticulum_openapi.integrations.fastapi import LXMFClientSettings
+from reticulum_openapi.conversion import normalise_response
 
 
 @pytest.fixture()
@@ -85,6 +98,52 @@ def test_client_manager_registers_lifecycle():
     assert created_clients[0].stop_called is True
 
 
+def test_client_manager_lifespan_exposes_client_on_app_state():
+    """The lifespan handler should create, publish, and shut down the client."""
+
+    class StubClient:
+        def __init__(self) -> None:
+            self.stop_called = False
+
+        def stop_listening_for_announces(self) -> None:
+            self.stop_called = True
+
+    created: List[StubClient] = []
+
+    def factory(_: LXMFClientSettings) -> StubClient:
+        created.append(StubClient())
+        return created[-1]
+
+    settings = LXMFClientSettings(server_identity_hash="0011")
+    manager = LXMFClientManager(
+        lambda: settings, client_factory=factory, announce_on_startup=False
+    )
+    app = FastAPI(lifespan=manager.lifespan())
+
+    with TestClient(app):
+        assert app.state.lxmf_client is created[0]
+        assert manager.get_client() is created[0]
+
+    assert len(created) == 1
+    assert created[0].stop_called is True
+
+
+def test_client_manager_set_client_overrides_factory():
+    """An injected client should be returned without invoking the factory."""
+
+    factory_calls: List[LXMFClientSettings] = []
+    settings = LXMFClientSettings(server_identity_hash="0011")
+    manager = LXMFClientManager(
+        lambda: settings, client_factory=factory_calls.append
+    )
+    injected = SimpleNamespace()
+
+    manager.set_client(injected)
+
+    assert manager.get_client() is injected
+    assert factory_calls == []
+
+
 def test_gather_interface_status_reports_metadata(stubbed_interfaces):
     """Interface helper should expose name, type, and status metadata."""
 
@@ -108,6 +167,135 @@ async def test_link_manager_connects_and_stops():
 
     stub_client.ensure_link.assert_awaited_once_with("001122")
     assert manager.status.state == "connected"
+    assert manager.status.to_dict()["lastSuccess"] == manager.status.last_success
+    assert manager.status.last_success.endswith("+00:00")
+    await manager.stop()
+
+
+def test_link_status_formats_failure_message_on_read():
+    """Failure messages should be built when the status is serialised."""
+
+    link_status = LinkStatus(server_identity="001122")
+
+    link_status.record_failure(TimeoutError("no path"), 2.5)
+
+    assert link_status.message is None
+    assert link_status.to_dict()["message"] == (
+        "Link to LXMF server 001122 failed: no path. Retrying in 2.5 seconds."
+    )
+
+
+def test_link_status_reuses_snapshot_until_changed():
+    """to_dict should return the cached mapping until an attribute changes."""
+
+    link_status = LinkStatus(state="connecting")
+
+    first = link_status.to_dict()
+    assert link_status.to_dict() is first
+
+    link_status.state = "connected"
+    second = link_status.to_dict()
+
+    assert second is not first
+    assert second["state"] == "connected"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_link_status_uses_slots():
+    """Link status objects should not carry a per-instance ``__dict__``."""
+
+    assert not hasattr(LinkStatus(), "__dict__")
+
+
+@pytest.mark.asyncio()
+async def test_link_manager_keepalive_probes_active_link():
+    """Keepalive should send probes over an active link without reconnecting."""
+
+    link = SimpleNamespace(status=RNS.Link.ACTIVE, send_keepalive=Mock())
+    stub_client = SimpleNamespace(ensure_link=AsyncMock(return_value=link))
+    manager = LinkManager(
+        lambda: stub_client,
+        retry_delay_seconds=0.01,
+        keepalive_interval_seconds=0.01,
+    )
+
+    manager.start("001122")
+    await asyncio.sleep(0.1)
+
+    assert link.send_keepalive.call_count > 1
+    stub_client.ensure_link.assert_awaited_once_with("001122")
+    assert manager.status.state == "connected"
+    await manager.stop()
+
+
+@pytest.mark.asyncio()
+async def test_link_manager_keepalive_reports_and_rebuilds_closed_link():
+    """A link that closes should be reported and reconnected."""
+
+    closed = SimpleNamespace(status=RNS.Link.ACTIVE, send_keepalive=Mock())
+    fresh = SimpleNamespace(status=RNS.Link.ACTIVE, send_keepalive=Mock())
+    reconnect = asyncio.Event()
+
+    async def ensure_link(_server_identity):
+        if stub_client.ensure_link.await_count == 1:
+            return closed
+        await reconnect.wait()
+        return fresh
+
+    stub_client = SimpleNamespace(ensure_link=AsyncMock(side_effect=ensure_link))
+    manager = LinkManager(
+        lambda: stub_client,
+        retry_delay_seconds=0.01,
+        keepalive_interval_seconds=0.01,
+    )
+
+    manager.start("001122")
+    await asyncio.sleep(0.02)
+    assert manager.status.state == "connected"
+
+    closed.status = RNS.Link.CLOSED
+    await asyncio.sleep(0.05)
+
+    assert manager.status.state == "connecting"
+    assert "lost" in manager.status.to_dict()["message"]
+
+    reconnect.set()
+    await asyncio.sleep(0.02)
+
+    assert stub_client.ensure_link.await_count == 2
+    assert manager.status.state == "connected"
+    await manager.stop()
+
+
+@pytest.mark.asyncio()
+async def test_link_manager_backs_off_exponentially(monkeypatch):
+    """Failed link attempts should double the retry delay up to the cap."""
+
+    from reticulum_openapi.integrations.fastapi import link as link_module
+
+    delays: List[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(link_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(link_module.random, "uniform", lambda low, high: 0.0)
+    failures = [RuntimeError("down")] * 4
+    stub_client = SimpleNamespace(ensure_link=AsyncMock(side_effect=failures + [None]))
+    manager = LinkManager(
+        lambda: stub_client,
+        retry_delay_seconds=5.0,
+        initial_retry_delay_seconds=1.0,
+    )
+
+    manager.start("001122")
+    for _ in range(20):
+        await real_sleep(0)
+
+    assert delays == [1.0, 2.0, 4.0, 5.0]
+    assert manager.status.state == "connected"
     await manager.stop()
 
 
@@ -134,3 +322,220 @@ async def test_command_context_translates_timeouts():
         await context.execute("test")
 
     assert excinfo.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+
+
+@pytest.mark.asyncio()
+async def test_command_context_execute_spec_skips_key_lookup():
+    """execute_spec should send a spec that is not registered by key."""
+
+    settings = LXMFClientSettings(server_identity_hash="001122")
+    stub_client = SimpleNamespace(send_command=AsyncMock(return_value={"ok": True}))
+    manager = LXMFClientManager(
+        lambda: settings,
+        client_factory=lambda _: stub_client,
+        announce_on_startup=False,
+    )
+    context = LXMFCommandContext(manager, "001122", {})
+
+    response = await context.execute_spec(
+        CommandSpec(command="Direct"), payload="value"
+    )
+
+    assert orjson.loads(response.body) == {"ok": True}
+    assert stub_client.send_command.await_args.args[:3] == ("001122", "Direct", "value")
+    with pytest.raises(KeyError):
+        await context.execute("missing")
+
+
+@pytest.mark.asyncio()
+async def test_command_context_coalesces_idempotent_commands():
+    """Concurrent identical idempotent commands should share one request."""
+
+    settings = LXMFClientSettings(server_identity_hash="001122")
+    release = asyncio.Event()
+
+    async def fake_send(*_args, **_kwargs):
+        await release.wait()
+        return {"items": []}
+
+    stub_client = SimpleNamespace(send_command=AsyncMock(side_effect=fake_send))
+    manager = LXMFClientManager(
+        lambda: settings,
+        client_factory=lambda _: stub_client,
+        announce_on_startup=False,
+    )
+    specs = {
+        "list": CommandSpec(command="ListItems", idempotent=True),
+        "create": CommandSpec(command="CreateItem"),
+    }
+    context = LXMFCommandContext(manager, "001122", specs)
+
+    pending = [asyncio.ensure_future(context.execute("list")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*pending)
+
+    assert stub_client.send_command.await_count == 1
+    assert all(response.body == b'{"items":[]}' for response in responses)
+
+    await asyncio.gather(context.execute("create"), context.execute("create"))
+    assert stub_client.send_command.await_count == 3
+
+
+@pytest.mark.asyncio()
+async def test_command_context_caches_responses_until_a_write():
+    """Cached reads should skip LXMF until a write clears the cache."""
+
+    settings = LXMFClientSettings(server_identity_hash="001122")
+    stub_client = SimpleNamespace(send_command=AsyncMock(return_value={"items": []}))
+    manager = LXMFClientManager(
+        lambda: settings,
+        client_factory=lambda _: stub_client,
+        announce_on_startup=False,
+    )
+    specs = {
+        "list": CommandSpec(
+            command="ListItems", idempotent=True, cache_ttl_seconds=60.0
+        ),
+        "create": CommandSpec(command="CreateItem"),
+    }
+    cache = {}
+    context = LXMFCommandContext(manager, "001122", specs, response_cache=cache)
+
+    await context.execute("list")
+    response = await context.execute("list")
+
+    assert response.body == b'{"items":[]}'
+    assert stub_client.send_command.await_count == 1
+    assert len(cache) == 1
+
+    await context.execute("create")
+    assert cache == {}
+
+    await context.execute("list")
+    assert stub_client.send_command.await_count == 3
+
+
+@pytest.mark.asyncio()
+async def test_command_context_does_not_cache_reads_overlapping_a_write():
+    """A read that finishes after a write must not be cached or joined."""
+
+    settings = LXMFClientSettings(server_identity_hash="001122")
+    release_read = asyncio.Event()
+    state = {"items": ["old"]}
+
+    async def fake_send(_server, command, *_args, **_kwargs):
+        if command == "CreateItem":
+            state["items"] = ["new"]
+            return {"created": True}
+        snapshot = dict(state)
+        if not release_read.is_set():
+            await release_read.wait()
+        return snapshot
+
+    stub_client = SimpleNamespace(send_command=AsyncMock(side_effect=fake_send))
+    manager = LXMFClientManager(
+        lambda: settings,
+        client_factory=lambda _: stub_client,
+        announce_on_startup=False,
+    )
+    specs = {
+        "list": CommandSpec(
+            command="ListItems", idempotent=True, cache_ttl_seconds=60.0
+        ),
+        "create": CommandSpec(command="CreateItem"),
+    }
+    cache = {}
+    context = LXMFCommandContext(manager, "001122", specs, response_cache=cache)
+
+    stale_read = asyncio.ensure_future(context.execute("list"))
+    while not stub_client.send_command.await_count:
+        await asyncio.sleep(0)
+    await context.execute("create")
+    release_read.set()
+
+    assert (await stale_read).body == b'{"items":["old"]}'
+    assert cache == {}
+
+    fresh = await context.execute("list")
+    assert fresh.body == b'{"items":["new"]}'
+    assert stub_client.send_command.await_count == 3
+
+
+def test_command_context_applies_path_params_without_mutating_body():
+    """Path parameters should override body values without copying the body."""
+
+    @dataclass
+    class Item:
+        uid: int
+        name: str = ""
+
+    settings = LXMFClientSettings(server_identity_hash="001122")
+    manager = LXMFClientManager(lambda: settings, announce_on_startup=False)
+    spec = CommandSpec(command="PutItem", request_type=Item, path_field="uid")
+    context = LXMFCommandContext(manager, "001122", {"item:update": spec})
+    body = {"name": "Alpha"}
+
+    payload = context._prepare_payload(spec, body, None, {"uid": "7"})
+
+    assert payload == Item(uid=7, name="Alpha")
+    assert body == {"name": "Alpha"}
+
+
+def test_orjson_response_renders_non_string_keys():
+    """ORJSONResponse should serialise integer keys like the stdlib encoder."""
+
+    response = ORJSONResponse(content={1: "one", "nested": [None, True]})
+
+    assert response.body == b'{"1":"one","nested":[null,true]}'
+    assert response.media_type == "application/json"
+
+
+def test_orjson_response_matches_normalised_dataclasses():
+    """Dataclass content should render like normalise_response output."""
+
+    class Level(Enum):
+        LOW = "low"
+
+    @dataclass
+    class Child:
+        name: str
+        note: Optional[str] = None
+
+    @dataclass
+    class Parent:
+        level: Level
+        children: List[Child]
+        tags: frozenset
+        missing: Optional[str] = None
+
+    value = [Parent(Level.LOW, [Child("a"), Child("b", "x")], frozenset({"t"}))]
+
+    response = ORJSONResponse(content=value)
+
+    assert orjson.loads(response.body) == normalise_response(value)
+
+
+def test_orjson_route_parses_bodies_and_rejects_malformed_json():
+    """ORJSONRoute should decode bodies with orjson and keep 422 errors."""
+
+    class Item(BaseModel):
+        name: str
+
+    app = FastAPI()
+    app.router.route_class = ORJSONRoute
+
+    @app.post("/items")
+    async def create_item(item: Item) -> dict:
+        return {"name": item.name}
+
+    with TestClient(app) as client:
+        ok = client.post("/items", json={"name": "Alpha"})
+        bad = client.post(
+            "/items",
+            content=b"{not json",
+            headers={"content-type": "application/json"},
+        )
+
+    assert ok.json() == {"name": "Alpha"}
+    assert bad.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
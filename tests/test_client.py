@@ -1,4 +1,7 @@
 import asyncio
+import json
+import threading
+import zlib
 from dataclasses import dataclass
 from types import SimpleNamespace
 import pytest
@@ -340,18 +343,17 @@ async def test_send_command_includes_token(monkeypatch):
 
     call_counter = {"count": 0}
 
-    original_dc_to_msgpack = client_module.dataclass_to_msgpack
+    original_encoder = client_module.to_canonical_bytes_with_entries
 
-    def fake_dataclass_to_msgpack(obj):
+    def fake_encoder(obj, entries):
         call_counter["count"] += 1
         captured["pre"] = obj
-        return original_dc_to_msgpack(obj)
+        return original_encoder(obj, entries)
 
-    monkeypatch.setattr(
-        client_module, "dataclass_to_msgpack", fake_dataclass_to_msgpack
-    )
+    monkeypatch.setattr(client_module, "to_canonical_bytes_with_entries", fake_encoder)
 
-    await cli.send_command("aa", "CMD", Sample(text="hello"), await_response=False)
+    sample = Sample(text="hello")
+    await cli.send_command("aa", "CMD", sample, await_response=False)
 
     assert captured["requests"]
     _, payload = captured["requests"][0]
@@ -359,7 +361,7 @@ async def test_send_command_includes_token(monkeypatch):
     assert decoded.get("auth_token") == "secret"
     assert decoded.get("text") == "hello"
     assert call_counter["count"] == 1
-    assert captured["pre"]["auth_token"] == "secret"
+    assert captured["pre"] is sample
 
 
 @pytest.mark.asyncio
@@ -383,6 +385,50 @@ async def test_callback_normalises_byte_titles():
     assert future.result() == b"data"
 
 
+@pytest.mark.asyncio
+async def test_callback_from_transport_thread_resolves_on_loop():
+    loop = asyncio.get_running_loop()
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._loop = loop
+    cli._futures = {}
+    cli._notification_listeners = set()
+
+    future = loop.create_future()
+    cli._futures["CMD_response"] = future
+    done_on = []
+    future.add_done_callback(lambda _f: done_on.append(threading.get_ident()))
+
+    thread = threading.Thread(
+        target=cli._callback,
+        args=(SimpleNamespace(title="CMD_response", content=b"data"),),
+    )
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(future, timeout=1.0) == b"data"
+    assert done_on == [threading.get_ident()]
+
+
+def test_client_loop_binds_lazily_to_running_loop():
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._bound_loop = None
+    queue = []
+    handler = client_module._AnnounceHandler(lambda: cli._bound_loop, queue)
+
+    handler.received_announce(b"\x01", object(), None)
+
+    async def bind():
+        return cli._loop
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(bind()) is loop
+        assert cli._bound_loop is loop
+    finally:
+        loop.close()
+    assert queue == []
+
+
 @pytest.mark.asyncio
 async def test_callback_ignores_invalid_byte_titles(monkeypatch):
     loop = asyncio.get_running_loop()
@@ -411,6 +457,96 @@ async def test_callback_ignores_invalid_byte_titles(monkeypatch):
     assert messages and "Invalid response title" in messages[0]
 
 
+@pytest.mark.asyncio
+async def test_callback_skips_title_decode_without_waiters(monkeypatch):
+    loop = asyncio.get_running_loop()
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._loop = loop
+    cli._futures = {}
+    cli._notification_listeners = set()
+
+    def fail_normalise(_title):
+        raise AssertionError("title should not be decoded")
+
+    monkeypatch.setattr(cli, "_normalise_message_title", fail_normalise)
+
+    cli._callback(SimpleNamespace(title=b"CMD_response", content=b"ignored"))
+
+
+@pytest.mark.asyncio
+async def test_send_command_falls_back_to_json_for_out_of_range_int():
+    loop = asyncio.get_running_loop()
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._loop = loop
+    cli.auth_token = None
+    cli.timeout = 0.1
+    requests = []
+    dest_hex = "aa" * 16
+    dest_hash = bytes.fromhex(dest_hex)
+    event = asyncio.Event()
+    event.set()
+    link = SimpleNamespace(
+        status=client_module.RNS.Link.ACTIVE,
+        request=lambda path, data=None, **kwargs: requests.append((path, data)),
+    )
+    cli._links = {dest_hash: link}
+    cli._link_events = {dest_hash: event}
+    cli._link_locks = {}
+
+    await cli.send_command(dest_hex, "CMD", 2**70, await_response=False)
+
+    assert requests
+    _, payload = requests[0]
+    assert json.loads(zlib.decompress(payload)) == 2**70
+
+
+@pytest.mark.asyncio
+async def test_send_command_replaces_closed_cached_link(monkeypatch):
+    loop = asyncio.get_running_loop()
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._loop = loop
+    cli.auth_token = None
+    cli.timeout = 0.2
+    dest_hex = "aa" * 16
+    dest_hash = bytes.fromhex(dest_hex)
+    stale_event = asyncio.Event()
+    stale_event.set()
+    stale_link = SimpleNamespace(
+        status=client_module.RNS.Link.CLOSED,
+        request=lambda *args, **kwargs: pytest.fail("closed link was reused"),
+    )
+    cli._links = {dest_hash: stale_link}
+    cli._link_events = {dest_hash: stale_event}
+    cli._link_locks = {}
+
+    monkeypatch.setattr(
+        client_module.RNS.Identity, "recall", lambda h, create=False: object()
+    )
+    monkeypatch.setattr(
+        cli, "_build_link_destination", lambda _identity: SimpleNamespace()
+    )
+
+    requests = []
+
+    class FakeLink:
+        ACTIVE = client_module.RNS.Link.ACTIVE
+
+        def __init__(self, _dest, established_callback=None, closed_callback=None):
+            self.status = self.ACTIVE
+            if established_callback:
+                loop.call_soon(established_callback, self)
+
+        def request(self, path, data=None, **kwargs):
+            requests.append((path, data))
+
+    monkeypatch.setattr(client_module.RNS, "Link", FakeLink)
+
+    await cli.send_command(dest_hex, "CMD", None, await_response=False)
+
+    assert requests == [("/commands/CMD", b"")]
+    assert isinstance(cli._links[dest_hash], FakeLink)
+
+
 def test_normalise_destination_hex_accepts_wrapped_brackets():
     value = client_module.LXMFClient._normalise_destination_hex(
         "  <A1B2C3D4E5F60708>  "
@@ -418,6 +554,23 @@ def test_normalise_destination_hex_accepts_wrapped_brackets():
     assert value == "a1b2c3d4e5f60708"
 
 
+def test_normalise_destination_hex_memoises_valid_input():
+    client_module._normalise_hex_string.cache_clear()
+    first = client_module.LXMFClient._normalise_destination_hex(" AABB ")
+    second = client_module.LXMFClient._normalise_destination_hex(" AABB ")
+    assert first == second == "aabb"
+    assert client_module._normalise_hex_string.cache_info().hits == 1
+
+
+def test_encode_scalar_payload_caches_by_type():
+    client_module._encode_scalar_payload.cache_clear()
+    assert client_module._encode_scalar_payload("abc") == b"\xa3abc"
+    assert client_module._encode_scalar_payload("abc") == b"\xa3abc"
+    assert client_module._encode_scalar_payload(1) == b"\x01"
+    info = client_module._encode_scalar_payload.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
 def test_normalise_destination_hex_rejects_invalid():
     with pytest.raises(ValueError):
         client_module.LXMFClient._normalise_destination_hex("not hex")
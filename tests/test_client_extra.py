@@ -231,17 +231,16 @@ async def test_send_command_dict_payload(monkeypatch):
 
     monkeypatch.setattr(client_module.RNS, "Link", FakeLink)
 
-    original = client_module.dataclass_to_msgpack
+    original = client_module.to_canonical_bytes_with_entries
 
-    def fake_dataclass_to_msgpack(obj):
+    def fake_encoder(obj, entries):
         captured["obj"] = obj
-        return original(obj)
+        return original(obj, entries)
 
-    monkeypatch.setattr(
-        client_module, "dataclass_to_msgpack", fake_dataclass_to_msgpack
-    )
+    monkeypatch.setattr(client_module, "to_canonical_bytes_with_entries", fake_encoder)
 
-    await cli.send_command("aa", "CMD", {"x": 1}, await_response=False)
+    request_body = {"x": 1}
+    await cli.send_command("aa", "CMD", request_body, await_response=False)
 
     assert captured["requests"]
     _, payload = captured["requests"][0]
@@ -249,6 +248,37 @@ async def test_send_command_dict_payload(monkeypatch):
     assert decoded["x"] == 1
     assert decoded["auth_token"] == "secret"
     assert captured["obj"]["x"] == 1
+    assert request_body == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_send_command_falls_back_to_json_for_float_payloads(caplog):
+    cli = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    cli._loop = asyncio.get_running_loop()
+    cli.auth_token = None
+    cli.timeout = 0.2
+    sent = []
+    established = asyncio.Event()
+    established.set()
+    cli._links = {
+        bytes.fromhex("aa"): SimpleNamespace(
+            status=client_module.RNS.Link.ACTIVE,
+            request=lambda path, data=None, timeout=None: sent.append(data),
+        )
+    }
+    cli._link_events = {bytes.fromhex("aa"): established}
+    cli._link_locks = {}
+    client_module._JSON_FALLBACK_TYPES.discard(dict)
+
+    with caplog.at_level("WARNING", logger=client_module.logger.name):
+        await cli.send_command("aa", "CMD", {"lat": 1.5}, await_response=False)
+        await cli.send_command("aa", "CMD", {"lat": 2.5}, await_response=False)
+
+    assert [client_module.decode_payload_bytes(data) for data in sent] == [
+        {"lat": 1.5},
+        {"lat": 2.5},
+    ]
+    assert sum("compressed JSON" in r.message for r in caplog.records) == 1
 
 
 def test_client_announce(monkeypatch):
@@ -450,6 +480,39 @@ async def test_resolve_destination_identity_timeout(monkeypatch):
     assert path_requests
 
 
+@pytest.mark.asyncio
+async def test_resolve_destination_identity_wakes_on_announce(monkeypatch):
+    loop = asyncio.get_running_loop()
+    client = client_module.LXMFClient.__new__(client_module.LXMFClient)
+    client._loop = loop
+    identity = object()
+    known = {}
+    handlers = []
+
+    monkeypatch.setattr(client_module.RNS.Identity, "recall", known.get)
+    monkeypatch.setattr(client_module.RNS.Transport, "request_path", lambda dest: None)
+    monkeypatch.setattr(
+        client_module.RNS.Transport, "register_announce_handler", handlers.append
+    )
+    monkeypatch.setattr(
+        client_module.RNS.Transport, "deregister_announce_handler", handlers.remove
+    )
+
+    def announce():
+        known[bytes.fromhex("abcd")] = identity
+        handlers[0].received_announce(bytes.fromhex("abcd"), identity, None)
+
+    loop.call_later(0.05, announce)
+    started = loop.time()
+    result = await client._resolve_destination_identity(
+        "abcd", bytes.fromhex("abcd"), 5.0
+    )
+
+    assert result is identity
+    assert loop.time() - started < 0.5
+    assert handlers == []
+
+
 @pytest.mark.asyncio
 async def test_discover_server_identity_returns_hex(monkeypatch):
     register_calls = _patch_dependencies(monkeypatch)
@@ -469,3 +532,21 @@ async def test_discover_server_identity_returns_hex(monkeypatch):
             await announcer
 
     assert result == "1020"
+
+
+def test_load_client_config_reports_invalid_json(tmp_path):
+    config_path = tmp_path / "client_config.json"
+    config_path.write_bytes(b'{"server_identity_hash": ')
+    errors = []
+
+    data = client_module.LXMFClient.load_client_config(
+        config_path, error_handler=errors.append
+    )
+
+    assert data == {}
+    assert errors and errors[0].startswith("Invalid JSON in")
+
+    config_path.write_bytes(b'{"server_identity_hash": "abcd"}')
+    assert client_module.LXMFClient.load_client_config(config_path) == {
+        "server_identity_hash": "abcd"
+    }
@@ -1,4 +1,9 @@
 import importlib
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import List
+from typing import Optional
+
 import pytest
 
 import reticulum_openapi.codec_msgpack as codec
@@ -78,6 +83,24 @@ def test_arrays_and_maps_ordering():
     assert enc == expected
 
 
+@dataclass
+class _Inner:
+    label: str
+
+
+@dataclass
+class _Outer:
+    zeta: int
+    alpha: Optional[str]
+    items: List[_Inner]
+
+
+def test_dataclass_packs_like_asdict():
+    """Dataclasses should encode to the same bytes as their asdict form."""
+    obj = _Outer(zeta=3, alpha=None, items=[_Inner("x"), _Inner("y")])
+    assert codec.to_canonical_bytes(obj) == codec.to_canonical_bytes(asdict(obj))
+
+
 def test_disallow_float():
     """Floats should not be allowed for canonical bytes."""
     with pytest.raises(codec.CodecError):
@@ -171,3 +194,17 @@ def test_verify_fails_with_ext_type():
     sig = codec.sign(canon, sk)
     bad = msgpack.packb({"a": msgpack.ExtType(1, b"\x00")}, use_bin_type=True)
     assert codec.verify(bad, pk, sig) is False
+
+
+def test_entries_merge_matches_packing_the_merged_map():
+    """Pre-encoded entries should pack like a dict holding the same values."""
+    obj = _Outer(zeta=3, alpha="a", items=[_Inner("x")])
+    entries = {"auth_token": codec.to_canonical_bytes("secret")}
+
+    expected = codec.to_canonical_bytes({**asdict(obj), "auth_token": "secret"})
+    assert codec.to_canonical_bytes_with_entries(obj, entries) == expected
+    assert codec.to_canonical_bytes_with_entries({"b": 1}, entries) == (
+        codec.to_canonical_bytes({"b": 1, "auth_token": "secret"})
+    )
+    with pytest.raises(codec.CodecError):
+        codec.to_canonical_bytes_with_entries("text", entries)
@@ -1,9 +1,15 @@
 """Tests for the reticulum_openapi.conversion module."""
 
+from dataclasses import dataclass
 from typing import List
 
+import pytest
+
 from examples.EmergencyManagement.Server.models_emergency import Event
 from examples.EmergencyManagement.Server.models_emergency import Point
+from reticulum_openapi.conversion import _dataclass_builder
+from reticulum_openapi.conversion import build_dataclass
+from reticulum_openapi.conversion import convert_value
 from reticulum_openapi.conversion import decode_payload
 from reticulum_openapi.conversion import normalise_response
 from reticulum_openapi.conversion import prepare_dataclass_payload
@@ -55,3 +61,39 @@ def test_decode_payload_supports_json_and_messagepack() -> None:
     assert decoded_msgpack == decoded_json
     assert decoded_msgpack.uid == event.uid
     assert decoded_msgpack.point == event.point
+
+
+def test_convert_value_coerces_primitive_strings() -> None:
+    """Primitive converters parse textual values and reject booleans as ints."""
+
+    assert convert_value(int, " 12 ") == 12
+    assert convert_value(float, "1.5") == 1.5
+    assert convert_value(bool, "yes") is True
+    assert convert_value(str, b"abc") == "abc"
+    with pytest.raises(TypeError):
+        convert_value(int, True)
+
+
+def test_build_dataclass_reuses_compiled_builder() -> None:
+    """Dataclass builders are compiled once and still coerce field values."""
+
+    builder = _dataclass_builder(Point)
+    assert builder is _dataclass_builder(Point)
+    assert build_dataclass(Point, {"lat": "1.5", "unknown": 1}) == Point(lat=1.5)
+    assert build_dataclass(Point, {"lat": None, "lon": 2.0}) == Point(lon=2.0)
+
+
+def test_build_dataclass_prefers_overrides_without_copying() -> None:
+    """Overrides should win over payload values and leave the payload intact."""
+
+    @dataclass
+    class Record:
+        uid: int
+        name: str = ""
+
+    payload = {"uid": 1, "name": "Alpha"}
+
+    record = build_dataclass(Record, payload, overrides={"uid": "9"})
+
+    assert record == Record(uid=9, name="Alpha")
+    assert payload == {"uid": 1, "name": "Alpha"}
@@ -105,3 +105,63 @@ async def test_create_movie_auth_failure() -> None:
     await asyncio.sleep(0.1)
 
     assert not called
+
+
+@pytest.mark.asyncio
+async def test_movie_controller_uses_injected_session_factory() -> None:
+    """Movie handlers should run against an injected session factory."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from examples.filmology.Server.controllers_filmology import MovieController
+    from examples.filmology.Server.models_filmology import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, expire_on_commit=False, class_=AsyncSession
+    )
+    controller = MovieController(session_factory=session_factory)
+
+    created = await controller.CreateMovie({"id": 7, "title": "Heat"})
+    listed = await controller.ListMovie()
+    retrieved = await controller.RetrieveMovie(7)
+    deleted = await controller.DeleteMovie(7)
+
+    assert created == Movie(id=7, title="Heat")
+    assert listed == [Movie(id=7, title="Heat")]
+    assert retrieved == Movie(id=7, title="Heat")
+    assert deleted == {"status": "deleted", "id": 7}
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_movie_pages_and_rejects_bad_paging() -> None:
+    """ListMovie should page results and answer 400 for invalid paging."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from examples.filmology.Server.controllers_filmology import MovieController
+    from examples.filmology.Server.models_filmology import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, expire_on_commit=False, class_=AsyncSession
+    )
+    controller = MovieController(session_factory=session_factory)
+    for movie_id in range(1, 4):
+        await controller.CreateMovie({"id": movie_id, "title": f"Movie {movie_id}"})
+
+    page = await controller.ListMovie({"skip": "1", "limit": 1})
+    bad_limit = await controller.ListMovie({"limit": "ten"})
+    negative_limit = await controller.ListMovie({"limit": -1})
+
+    assert page == [Movie(id=2, title="Movie 2")]
+    assert bad_limit == {"error": "'limit' must be an integer", "code": 400}
+    assert negative_limit == {"error": "'limit' must not be negative", "code": 400}
+    await engine.dispose()
@@ -108,8 +108,7 @@ async def test_webui_post_persists_emergency_action_message(
     server_identity = "aa" * 32
     stub_client = InProcessLXMFClient(routes, server_identity)
 
-    monkeypatch.setattr(module, "get_shared_client", lambda: stub_client, raising=False)
-    monkeypatch.setattr(module, "_CLIENT_INSTANCE", stub_client, raising=False)
+    module._CLIENT_MANAGER.set_client(stub_client)
     monkeypatch.setattr(module, "_DEFAULT_SERVER_IDENTITY", server_identity, raising=False)
 
     payload = {
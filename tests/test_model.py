@@ -157,3 +157,24 @@ async def test_update_returns_dataclass_instance():
         updated = await ItemRecord.update(session, 1, name="new")
         assert isinstance(updated, ItemRecord)
         assert updated.name == "new"
+
+
+@pytest.mark.asyncio
+async def test_list_pages_and_stream_yields_records():
+    """``list`` should page by primary key and ``stream`` yield every row."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_factory = async_sessionmaker(
+        engine, expire_on_commit=False, class_=AsyncSession
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory() as session:
+        for identifier in (3, 1, 2):
+            await ItemRecord.create(session, id=identifier, name=f"item-{identifier}")
+        page = await ItemRecord.list(session, limit=2, offset=1)
+        streamed = [item async for item in ItemRecord.stream(session, batch_size=1)]
+    await engine.dispose()
+
+    assert [item.id for item in page] == [2, 3]
+    assert sorted(item.id for item in streamed) == [1, 2, 3]
+    assert all(isinstance(item, ItemRecord) for item in streamed)
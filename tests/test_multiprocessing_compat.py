@@ -0,0 +1,34 @@
+"""Tests for :mod:`reticulum_openapi._multiprocessing_compat`."""
+
+import multiprocessing
+import subprocess
+import sys
+
+from reticulum_openapi import _multiprocessing_compat as mp_compat
+
+
+def test_install_and_uninstall_swap_set_start_method() -> None:
+    """The guard should only wrap set_start_method while installed."""
+
+    previous = multiprocessing.set_start_method
+    try:
+        mp_compat.uninstall()
+        assert multiprocessing.set_start_method is mp_compat._ORIGINAL_SET_START_METHOD
+
+        mp_compat.install()
+        assert multiprocessing.set_start_method is mp_compat._safe_set_start_method
+    finally:
+        multiprocessing.set_start_method = previous
+
+
+def test_importing_package_leaves_set_start_method_untouched() -> None:
+    """Only starting a service or gateway should install the guard."""
+
+    script = (
+        "import multiprocessing\n"
+        "original = multiprocessing.set_start_method\n"
+        "import reticulum_openapi\n"
+        "import reticulum_openapi.service\n"
+        "assert multiprocessing.set_start_method is original\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -17,6 +17,7 @@ from sqlalchemy.orm import declarative_base
 from reticulum_openapi.controller import Controller
 from reticulum_openapi.model import BaseModel
 from reticulum_openapi.sqlalchemy_controller import SQLAlchemyControllerMixin
+from reticulum_openapi.sqlalchemy_controller import _payload_values
 
 
 Base = declarative_base()
@@ -125,3 +126,19 @@ async def test_mixin_class_level_session_factory(dummy_session_factory) -> None:
         assert result.id == 5
     finally:
         DummyController.configure_session_factory(None)
+
+
+def test_payload_values_copies_flat_fields_and_converts_nested() -> None:
+    """Flat payloads should be copied shallowly and nested ones via asdict."""
+
+    @dataclass
+    class Nested:
+        inner: DummyModel
+
+    assert _payload_values(DummyModel(id=1, name="first")) == {
+        "id": 1,
+        "name": "first",
+    }
+    assert _payload_values(Nested(inner=DummyModel(id=2, name="two"))) == {
+        "inner": {"id": 2, "name": "two"}
+    }